@@ -0,0 +1,332 @@
+"""
+Benchmarks how the collision engine scales, using the synthetic levels of the
+level generator (see benchmarks.generator), far larger than any level of the
+game.
+
+A generated level is loaded the way the game loads its levels, either
+parsed from JSON (where the collision engine merges the walls and static
+platforms) or compiled (where they were baked into colliders ahead of time),
+and optionally streamed. It is then run headlessly frame by frame, timing
+every pass of the collision engine (i.e. the broadphase and the responses to
+each collision layer) in every physics step. The timings are summarised into
+percentiles, which can be saved as JSON to compare the results across
+commits. For example, from the root of the repository:
+
+    python -m benchmarks.collision --frames 300 --output before.json
+    python -m benchmarks.collision --frames 300 --baseline before.json
+    python -m benchmarks.collision --sections 400 --compiled --streamed
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+
+# Must come first, to select the dummy SDL drivers before pygame is set up
+import xcape.engines.headless as headless
+import pygame as pg
+
+import xcape.common.settings as settings
+from benchmarks.generator import generateLevel
+from xcape.common import level as levels
+from xcape.common.scene import BaseScene
+from xcape.components.camera import SimpleCamera
+from xcape.engines.collision import CollisionEngine
+from xcape.engines.physics import PhysicsWorld
+
+
+class GeneratedScene(BaseScene):
+    """
+    A scene playing a generated level (see benchmarks.generator), where the
+    players are driven by simple scripted inputs instead of the keyboard,
+    and the camera follows the first player.
+    """
+
+    def __init__(self, screen, level, isStreamed=False, seed=0):
+        """
+        :param screen: pygame.Surface, representing the screen.
+        :param level: Level instance, representing the generated level.
+        :param isStreamed: Boolean, whether to stream the level in chunks
+        around the camera and the players, as the game does with large
+        levels.
+        :param seed: Integer, the seed of the scripted inputs.
+        """
+        super().__init__(screen)
+        self.random = random.Random(seed)
+        self.addLevel(level, isStreamed)
+
+        self.camera = SimpleCamera(settings.WIDTH, settings.HEIGHT)
+        self.camera.follow(self.players[0])
+
+        # The direction each player is currently running in
+        self.directions = [self.random.choice([-1, 1]) for _ in self.players]
+
+    def __str__(self):
+        return "generated_scene"
+
+    def update(self):
+        self.focus(self.camera)
+        self.registry.update()
+
+        for i, player in enumerate(self.players):
+            if self.random.random() < 0.02:
+                self.directions[i] *= -1
+            if self.random.random() < 0.05:
+                player.jump()
+
+            if self.directions[i] < 0:
+                player.moveLeft()
+            else:
+                player.moveRight()
+
+    def draw(self, camera=None):
+        self.screen.fill(settings.COLOURS["black_red"])
+
+        self.registry.draw(camera)
+
+
+class PassTimer:
+    """
+    Times every pass of a collision engine, summed up over each physics step
+    (i.e. each update of the collision engine).
+
+    The passes are timed by wrapping the methods of the collision engine
+    instance, so the collision engine itself is left untouched.
+    """
+
+    def __init__(self, collisionEngine):
+        """
+        :param collisionEngine: CollisionEngine instance, to be timed.
+        """
+        self.timings = {}
+        self.samples = {}
+
+        engine = collisionEngine
+        update = self.wrap("total", engine.update)
+
+        def step():
+            update()
+            self.endStep()
+
+        engine.update = step
+        engine.findDynamicContacts = self.wrap("broadphase_dynamic",
+                                               engine.findDynamicContacts)
+        engine.findContacts = self.wrap("broadphase_static",
+                                        engine.findContacts)
+        engine.layerToResponses = {
+            layer: [(other, self.wrap(other, respond))
+                    for other, respond in responses]
+            for layer, responses in engine.layerToResponses.items()}
+
+    def wrap(self, name, function):
+        """
+        :param name: String, the name of the pass.
+        :param function: Function, running the pass.
+        :return: Function, running the pass and adding up its timing.
+        """
+        self.samples[name] = []
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            elapsed = 1000*(time.perf_counter() - start)
+            self.timings[name] = self.timings.get(name, 0) + elapsed
+            return result
+
+        return timed
+
+    def endStep(self):
+        """
+        Completes the current physics step, recording the timings of all
+        passes.
+        """
+        for name, samples in self.samples.items():
+            samples.append(self.timings.get(name, 0))
+        self.timings = {}
+
+
+def percentile(samples, p):
+    """
+    :param samples: List, containing numbers.
+    :param p: Number, the percentile between 0 and 100.
+    :return: Number, the nearest ranked sample at the percentile.
+    """
+    ordered = sorted(samples)
+    rank = max(0, -(-len(ordered)*p // 100) - 1)
+    return ordered[int(rank)]
+
+
+def summarise(samples):
+    """
+    :param samples: List, containing the milliseconds taken every physics
+    step.
+    :return: Dictionary, containing the mean and percentiles in milliseconds.
+    """
+    if not samples:
+        return {}
+
+    return {
+        "mean": sum(samples)/len(samples),
+        "p50": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "p99": percentile(samples, 99),
+        "max": max(samples),
+    }
+
+
+def findCommit():
+    """
+    :return: String, the hash of the checked out git commit, or None if it
+    cannot be found.
+    """
+    try:
+        output = subprocess.check_output(["git", "rev-parse", "HEAD"],
+                                         stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode().strip()
+
+
+def run(frames=300, sections=100, density=2, players=8, bosses=8, seed=0,
+        isCompiled=False, isStreamed=False, isVectorised=False):
+    """
+    Runs the collision engine on a generated level.
+
+    :param frames: Integer, the number of frames to run.
+    :param sections: Integer, the number of sections of the level.
+    :param density: Number, scaling how many entities are in a section.
+    :param players: Integer, the number of players.
+    :param bosses: Integer, the number of bosses.
+    :param seed: Integer, the seed of the level and the scripted inputs.
+    :param isCompiled: Boolean, whether to load the level compiled, with its
+    walls and static platforms baked into colliders.
+    :param isStreamed: Boolean, whether to stream the level.
+    :param isVectorised: Boolean, whether to step the bodies using NumPy.
+    :return: Dictionary, containing the configuration and timings of the run.
+    """
+    screen = pg.display.get_surface()
+    source = generateLevel(sections, density, players, bosses, seed)
+    data = levels.compileLevel(source) if isCompiled else None
+
+    start = time.perf_counter()
+    if isCompiled:
+        level = levels.decodeLevel(data)
+    else:
+        level = levels.parseLevel(source)
+    scene = GeneratedScene(screen, level, isStreamed, seed)
+    collisionEngine = CollisionEngine(scene)
+    collisionEngine.subscribe(scene.router)
+    loading = 1000*(time.perf_counter() - start)
+
+    physicsWorld = PhysicsWorld(collisionEngine, isVectorised=isVectorised)
+    physicsWorld.addScene(scene)
+    physicsWorld.add(scene.camera.physics)
+    scene.focus(scene.camera)
+    timer = PassTimer(collisionEngine)
+
+    renderer = headless.HeadlessRenderer(capture=None)
+    renderer.render(scene, frames, camera=scene.camera,
+                    physicsWorld=physicsWorld)
+
+    return {
+        "commit": findCommit(),
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "config": {
+            "frames": frames,
+            "sections": sections,
+            "density": density,
+            "players": players,
+            "bosses": bosses,
+            "seed": seed,
+            "isCompiled": isCompiled,
+            "isStreamed": isStreamed,
+            "isVectorised": isVectorised,
+        },
+        "entities": {kind: len(getattr(level, kind))
+                     for kind in levels.RECORDS},
+        "colliders": len(collisionEngine.grid),
+        "physicsSteps": physicsWorld.steps,
+        "loading": loading,
+        "passes": {name: summarise(samples)
+                   for name, samples in timer.samples.items()},
+    }
+
+
+def report(results, baseline=None):
+    """
+    Prints the timings of a run as a table, along with the change in the
+    median timings since a baseline run.
+
+    :param results: Dictionary, containing the results of a run.
+    :param baseline: Dictionary, containing the results of an earlier run.
+    """
+    print("commit: {}".format(results["commit"]))
+    print("config: {}".format(results["config"]))
+    print("entities: {}".format(", ".join(
+        "{} {}".format(count, kind)
+        for kind, count in sorted(results["entities"].items()) if count)))
+    print("colliders: {}, physics steps: {}, loading: {:.1f} ms"
+          .format(results["colliders"],
+                  results["physicsSteps"],
+                  results["loading"]))
+
+    header = "{:<20}{:>9}{:>9}{:>9}{:>9}{:>9}".format(
+        "pass (ms/step)", "mean", "p50", "p90", "p99", "max")
+    if baseline:
+        header += "{:>12}".format("p50 change")
+    print(header)
+
+    for name, stats in sorted(results["passes"].items()):
+        if not stats:
+            continue
+
+        line = "{:<20}{mean:>9.3f}{p50:>9.3f}{p90:>9.3f}{p99:>9.3f}" \
+               "{max:>9.3f}".format(name, **stats)
+        before = baseline["passes"].get(name) if baseline else None
+        if before and before["p50"]:
+            change = 100*(stats["p50"] - before["p50"])/before["p50"]
+            line += "{:>+11.1f}%".format(change)
+        print(line)
+
+
+def main():
+    """
+    Runs the benchmark from the command line.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--sections", type=int, default=100)
+    parser.add_argument("--density", type=float, default=2)
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--bosses", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compiled", action="store_true",
+                        help="load the level compiled, with baked colliders")
+    parser.add_argument("--streamed", action="store_true",
+                        help="stream the level around the players")
+    parser.add_argument("--vectorised", action="store_true",
+                        help="step the bodies using NumPy")
+    parser.add_argument("--output", help="file to save the results to")
+    parser.add_argument("--baseline", help="results to compare against")
+    args = parser.parse_args()
+
+    results = run(args.frames, args.sections, args.density, args.players,
+                  args.bosses, args.seed, args.compiled, args.streamed,
+                  args.vectorised)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    report(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
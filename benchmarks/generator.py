@@ -0,0 +1,320 @@
+"""
+Generates synthetic levels far larger than any level of the game, written as
+JSON in the same format as the levels of the game (see level.parseLevel), to
+benchmark e.g. loading, collisions, rendering and memory at scale.
+
+A level is a row of sections built from a seed, so the same arguments always
+generate the same level. The size of a level is set by its number of
+sections, and how crowded each section is by its density. For example, from
+the root of the repository:
+
+    python -m benchmarks.generator --sections 100 --output synthetic.json
+    python -m benchmarks.generator --sections 100 --density 4 --players 20 \\
+        --bosses 10 --output synthetic.json --compile
+
+A generated level can be parsed and added to a scene as it is, but then its
+walls and static platforms are merged into colliders every time it is
+loaded (see level.bakeColliders), by building all of them. Compiling it
+(--compile) bakes the colliders once, so that loading a streamed level only
+builds the chunks near the players.
+"""
+
+import argparse
+import json
+import random
+
+from xcape.common import level as levels
+
+
+class LevelGenerator:
+    """
+    Generates a level section by section, from left to right.
+
+    Every section has a floor split by a pit lined with spikes, which a
+    moving platform carries the players across. Above the floor there are
+    static, directional and vertically moving platforms, along with the
+    switches and the torches. Each section ends with a door waiting for the
+    switches of the section, hence the doors form a chain where the level
+    is only completed once every switch has been turned off.
+
+    The players spawn a few to a section, before the pit, from the first
+    section onwards.
+    """
+
+    SECTION_WIDTH = 1280
+    FLOOR_Y = 600
+    PIT_X = 512
+    PIT_WIDTH = 256
+    PIT_DEPTH = 180
+    BLOCK_WIDTH = 64
+    SPIKE_SIZE = (21, 24)
+    PLAYERS_PER_SECTION = 5
+    PLAYER_SPACING = 60
+
+    # The number of a player is stored in a single byte (see level.RECORDS)
+    MAX_PLAYERS = 255
+
+    FLOOR_IMAGES = [
+        "zone1/walls/block_left/0",
+        "zone1/walls/block_mid/0",
+        "zone1/walls/block_right/0",
+    ]
+    SPIKE_IMAGE = "zone1/traps/spike_up/0"
+    H_PLATFORM_IMAGE = "zone1/platforms/moving_horizontal"
+    V_PLATFORM_IMAGE = "zone1/platforms/moving_vertical"
+    TORCH_IMAGE = "zone1/decorations/torch"
+
+    # The number of each kind of entity in a section at a density of 1
+    PLATFORMS = 2
+    MOVING_PLATFORMS = 1
+    SWITCHES = 2
+    TORCHES = 1
+
+    def __init__(self, density=1, seed=0):
+        """
+        :param density: Number, scaling how many entities are in a section.
+        :param seed: Integer, the seed of the level.
+        """
+        self.density = density
+        self.random = random.Random(seed)
+        self.source = {}
+        self.switches = 0
+
+    def generate(self, sections, players=1, bosses=1):
+        """
+        :param sections: Integer, the number of sections.
+        :param players: Integer, the number of players.
+        :param bosses: Integer, the number of bosses.
+        :return: Dictionary, containing the level written as JSON.
+        """
+        if not 1 <= players <= self.MAX_PLAYERS:
+            raise ValueError("A level can have from 1 to {} players, not {}!"
+                             .format(self.MAX_PLAYERS, players))
+        if sections < 1:
+            raise ValueError("A level needs at least a single section!")
+
+        self.source = {kind: [] for kind in levels.RECORDS
+                       if kind != "colliders"}
+        self.switches = 0
+
+        for i in range(sections):
+            self.addSection(i)
+        self.addPlayers(players, sections)
+        self.addBosses(bosses, sections)
+        return self.source
+
+    def addSection(self, i):
+        """
+        :param i: Integer, the index of the section from the left.
+        """
+        x = i*self.SECTION_WIDTH
+        self.addFloor(x)
+        self.addPit(x + self.PIT_X)
+
+        nums = []
+        for _ in range(self._count(self.SWITCHES)):
+            nums.append(self.addSwitch(x))
+        for _ in range(self._count(self.PLATFORMS)):
+            self.addPlatform(x)
+        for _ in range(self._count(self.MOVING_PLATFORMS)):
+            self.addVerticalPlatform(x)
+        for _ in range(self._count(self.TORCHES)):
+            self.addTorch(x)
+        self.addDoor(x, i + 1, nums)
+
+    def addFloor(self, x):
+        """
+        :param x: Integer, the x-position of the section.
+        """
+        right = self.PIT_X + self.PIT_WIDTH
+        for start, end in ((0, self.PIT_X), (right, self.SECTION_WIDTH)):
+            self.addWall(x + start, self.FLOOR_Y,
+                         (end - start)//self.BLOCK_WIDTH)
+
+    def addPit(self, x):
+        """
+        :param x: Integer, the x-position of the pit.
+        """
+        y = self.FLOOR_Y + self.PIT_DEPTH
+        self.addWall(x, y, self.PIT_WIDTH//self.BLOCK_WIDTH)
+
+        w, h = self.SPIKE_SIZE
+        self.source["spikes"].append({
+            "x": x,
+            "y": y - h,
+            "blocks": self.PIT_WIDTH//w,
+            "orientation": "h",
+            "image": self.SPIKE_IMAGE,
+        })
+
+        y = self.FLOOR_Y - 20
+        self.source["mPlatforms"].append({
+            "A": [x, y],
+            "B": [x + self.PIT_WIDTH - 40, y],
+            "dx": self.random.choice([2, 3, 4]),
+            "dy": 0,
+            "image": self.H_PLATFORM_IMAGE,
+        })
+
+    def addWall(self, x, y, blocks):
+        """
+        :param x: Integer, the x-position of the wall.
+        :param y: Integer, the y-position of the wall.
+        :param blocks: Integer, the number of blocks.
+        """
+        self.source["walls"].append({
+            "x": x,
+            "y": y,
+            "blocks": max(blocks, 2),
+            "orientation": "h",
+            "images": list(self.FLOOR_IMAGES),
+        })
+
+    def addPlatform(self, x):
+        """
+        :param x: Integer, the x-position of the section.
+        """
+        kind = self.random.choice(["sPlatforms", "dPlatforms"])
+        self.source[kind].append({
+            "x": x + self.random.randrange(0, self.SECTION_WIDTH - 200),
+            "y": self.FLOOR_Y - self.random.randrange(120, 360),
+            "blocks": self.random.randint(1, 3),
+            "zone": 1,
+        })
+
+    def addVerticalPlatform(self, x):
+        """
+        :param x: Integer, the x-position of the section.
+        """
+        x += self.random.randrange(0, self.SECTION_WIDTH - 100)
+        self.source["mPlatforms"].append({
+            "A": [x, self.FLOOR_Y - 400],
+            "B": [x, self.FLOOR_Y - 100],
+            "dx": 0,
+            "dy": self.random.choice([2, 3, 4]),
+            "image": self.V_PLATFORM_IMAGE,
+        })
+
+    def addSwitch(self, x):
+        """
+        :param x: Integer, the x-position of the section.
+        :return: Integer, the number of the switch.
+        """
+        self.switches += 1
+        self.source["switches"].append({
+            "x": x + self.random.randrange(0, self.SECTION_WIDTH - 100),
+            "y": self.FLOOR_Y - self.random.choice([32, 200, 320]),
+            "num": self.switches,
+            "zone": 1,
+        })
+        return self.switches
+
+    def addDoor(self, x, num, switches):
+        """
+        :param x: Integer, the x-position of the section.
+        :param num: Integer, the number of the door.
+        :param switches: List, containing the numbers of the switches the
+        door waits for.
+        """
+        self.source["doors"].append({
+            "x": x + self.SECTION_WIDTH - 100,
+            "y": self.FLOOR_Y - 110,
+            "num": num,
+            "zone": 1,
+            "switches": switches,
+        })
+
+    def addTorch(self, x):
+        """
+        :param x: Integer, the x-position of the section.
+        """
+        self.source["decorations"].append({
+            "x": x + self.random.randrange(0, self.SECTION_WIDTH - 40),
+            "y": self.FLOOR_Y - 200,
+            "image": self.TORCH_IMAGE,
+        })
+
+    def addPlayers(self, total, sections):
+        """
+        :param total: Integer, the number of players.
+        :param sections: Integer, the number of sections.
+        """
+        for i in range(total):
+            section, slot = divmod(i, self.PLAYERS_PER_SECTION)
+            x = (section % sections)*self.SECTION_WIDTH
+            self.source["players"].append({
+                "num": i + 1,
+                "spawn": [x + 100 + self.PLAYER_SPACING*(slot + 1),
+                          self.FLOOR_Y - 100],
+            })
+
+    def addBosses(self, total, sections):
+        """
+        :param total: Integer, the number of bosses.
+        :param sections: Integer, the number of sections.
+        """
+        for _ in range(total):
+            x = self.random.randrange(sections)*self.SECTION_WIDTH
+            self.source["bosses"].append({
+                "spawn": [x + self.SECTION_WIDTH//2, self.FLOOR_Y - 300],
+            })
+
+    def _count(self, number):
+        """
+        Scales a number of entities by the density, where a fraction left
+        over adds one more entity by chance.
+
+        :param number: Integer, the number of entities at a density of 1.
+        :return: Integer, the scaled number of entities.
+        """
+        total = number*self.density
+        return int(total) + (self.random.random() < total % 1)
+
+
+def generateLevel(sections=10, density=1, players=1, bosses=1, seed=0):
+    """
+    Generates a synthetic level.
+
+    :param sections: Integer, the number of sections.
+    :param density: Number, scaling how many entities are in a section.
+    :param players: Integer, the number of players.
+    :param bosses: Integer, the number of bosses.
+    :param seed: Integer, the seed of the level.
+    :return: Dictionary, containing the level written as JSON.
+    """
+    generator = LevelGenerator(density, seed)
+    return generator.generate(sections, players, bosses)
+
+
+def main():
+    """
+    Generates a level from the command line.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--density", type=float, default=1)
+    parser.add_argument("--players", type=int, default=1)
+    parser.add_argument("--bosses", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True,
+                        help="file to save the level to")
+    parser.add_argument("--compile", action="store_true",
+                        help="also compile the level next to it")
+    args = parser.parse_args()
+
+    source = generateLevel(args.sections, args.density, args.players,
+                           args.bosses, args.seed)
+    level = levels.parseLevel(source)
+
+    with open(args.output, "w") as file:
+        json.dump(source, file, indent=4)
+    print("Generated '{}' ({})".format(args.output, ", ".join(
+        "{} {}".format(len(getattr(level, kind)), kind)
+        for kind in levels.RECORDS if getattr(level, kind))))
+
+    if args.compile:
+        levels.main([args.output])
+
+
+if __name__ == "__main__":
+    main()
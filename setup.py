@@ -42,6 +42,7 @@ buildOptions = dict(packages=["pygame",
                                    "LICENSE.txt",
                                    "sfx/",
                                    "images/",
+                                   "levels/",
                                    "extra/"],
                     build_exe="build")
 
@@ -0,0 +1,384 @@
+"""
+Responsible for the file format of the levels.
+
+The levels are written as JSON (see parseLevel for the fields) and compiled
+into a compact binary file, which is all the game needs to load a level.
+Compiling a level needs the game assets (to measure the entities), hence it
+is done ahead of time, e.g. from the root of the repository:
+
+    python -m xcape.common.level levels/*.json
+
+The binary file starts with a header, followed by tables of the strings (the
+paths of images), the sets of images and the switches each door waits for,
+and then by the records of each kind of entity. Every table and every kind of
+record is stored as a count followed by fixed size records back to back, so
+that loading a level is a single pass of struct unpacking.
+"""
+
+import os
+import struct
+from collections import OrderedDict, namedtuple
+
+# Identifies a compiled level file, followed by the version of its layout
+MAGIC = b"XLVL"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sH")
+_COUNT = struct.Struct("<I")
+_STRING = struct.Struct("<H")
+_INDEX = struct.Struct("<H")
+
+_LEVELS_PATH = os.path.join("levels")
+_EXTENSION = ".lvl"
+
+# The collision layers that colliders can be baked into (matching the layers
+# of the collision engine)
+LAYERS = [
+    "solid",
+    "one_way",
+    "carrier",
+    "trigger",
+    "hazard",
+]
+
+ORIENTATIONS = [
+    "h",
+    "v",
+]
+
+PlayerData = namedtuple("PlayerData", "num x y")
+BossData = namedtuple("BossData", "x y")
+WallData = namedtuple("WallData", "x y blocks orientation images")
+PlatformData = namedtuple("PlatformData", "x y blocks zone")
+MPlatformData = namedtuple("MPlatformData", "ax ay bx by dx dy images")
+SwitchData = namedtuple("SwitchData", "x y num zone")
+DoorData = namedtuple("DoorData", "x y num zone switches")
+SpikeData = namedtuple("SpikeData", "x y blocks orientation images")
+SpearData = namedtuple("SpearData", "x y")
+DecorationData = namedtuple("DecorationData", "x y images")
+ColliderData = namedtuple("ColliderData", "x y w h layer")
+
+# The layout of the records of each kind of entity, in the order they are
+# stored. The orientations and layers are stored as indices, the images as
+# an index into the table of image sets, and the switches of a door as the
+# start and length of a slice of the table of switches.
+RECORDS = OrderedDict([
+    ("players", (PlayerData, struct.Struct("<Bii"))),
+    ("bosses", (BossData, struct.Struct("<ii"))),
+    ("walls", (WallData, struct.Struct("<iiHBH"))),
+    ("sPlatforms", (PlatformData, struct.Struct("<iiHB"))),
+    ("dPlatforms", (PlatformData, struct.Struct("<iiHB"))),
+    ("mPlatforms", (MPlatformData, struct.Struct("<iiiiiiH"))),
+    ("switches", (SwitchData, struct.Struct("<iiHB"))),
+    ("doors", (DoorData, struct.Struct("<iiHBHH"))),
+    ("spikes", (SpikeData, struct.Struct("<iiHBH"))),
+    ("spears", (SpearData, struct.Struct("<ii"))),
+    ("decorations", (DecorationData, struct.Struct("<iiH"))),
+    ("colliders", (ColliderData, struct.Struct("<iiiiB"))),
+])
+
+# Compiled levels that have already been loaded
+_nameToLevel = {}
+
+
+class Level:
+    """
+    The contents of a level, as lists of records for each kind of entity.
+
+    The images are referenced by tuples of paths (see loader.findImage), and
+    the colliders are the rects baked from the entities when the level was
+    compiled (e.g. the merged walls and static platforms).
+    """
+
+    def __init__(self, **kindToRecords):
+        """
+        :param kindToRecords: Lists, containing the records of each kind of
+        entity named in RECORDS (missing kinds are left empty).
+        """
+        for kind in RECORDS:
+            setattr(self, kind, list(kindToRecords.pop(kind, [])))
+
+        if kindToRecords:
+            raise ValueError("{} are invalid kinds of entities! The kinds "
+                             "allowed are {}!"
+                             .format(list(kindToRecords), list(RECORDS)))
+
+
+def parseLevel(source):
+    """
+    Converts a level written as JSON (already decoded into a dictionary) into
+    a level, without any colliders.
+
+    The level has a list for each kind of entity, where the positions and
+    images of the entities are written as below (the zone, blocks and
+    orientation can be left out, defaulting to 1, 1 and 'h').
+
+    players:        {"num", "spawn": [x, y]}
+    bosses:         {"spawn": [x, y]}
+    walls:          {"x", "y", "blocks", "orientation", "images"}
+    sPlatforms:     {"x", "y", "blocks", "zone"}
+    dPlatforms:     {"x", "y", "blocks", "zone"}
+    mPlatforms:     {"A": [x, y], "B": [x, y], "dx", "dy", "image"}
+    switches:       {"x", "y", "num", "zone"}
+    doors:          {"x", "y", "num", "zone", "switches": [num, ...]}
+    spikes:         {"x", "y", "blocks", "orientation", "image"}
+    spears:         {"x", "y"}
+    decorations:    {"x", "y", "image"}
+
+    The images of a wall are either the path of an animation, or a list of
+    paths to the three images it is built from.
+
+    :param source: Dictionary, containing the level written as JSON.
+    :return: Level instance, representing the level.
+    """
+    def images(value):
+        if isinstance(value, str):
+            return (value,)
+        return tuple(value)
+
+    def orientation(entity):
+        return entity.get("orientation", "h")
+
+    level = Level()
+    for e in source.get("players", []):
+        level.players.append(PlayerData(e["num"], *e["spawn"]))
+    for e in source.get("bosses", []):
+        level.bosses.append(BossData(*e["spawn"]))
+    for e in source.get("walls", []):
+        level.walls.append(WallData(e["x"], e["y"], e.get("blocks", 1),
+                                    orientation(e), images(e["images"])))
+    for kind in ("sPlatforms", "dPlatforms"):
+        for e in source.get(kind, []):
+            getattr(level, kind).append(PlatformData(e["x"], e["y"],
+                                                     e.get("blocks", 1),
+                                                     e.get("zone", 1)))
+    for e in source.get("mPlatforms", []):
+        level.mPlatforms.append(MPlatformData(*e["A"] + e["B"] +
+                                              [e["dx"], e["dy"],
+                                               images(e["image"])]))
+    for e in source.get("switches", []):
+        level.switches.append(SwitchData(e["x"], e["y"], e["num"],
+                                         e.get("zone", 1)))
+    for e in source.get("doors", []):
+        level.doors.append(DoorData(e["x"], e["y"], e["num"],
+                                    e.get("zone", 1), tuple(e["switches"])))
+    for e in source.get("spikes", []):
+        level.spikes.append(SpikeData(e["x"], e["y"], e.get("blocks", 1),
+                                      orientation(e), images(e["image"])))
+    for e in source.get("spears", []):
+        level.spears.append(SpearData(e["x"], e["y"]))
+    for e in source.get("decorations", []):
+        level.decorations.append(DecorationData(e["x"], e["y"],
+                                                images(e["image"])))
+
+    switches = {s.num for s in level.switches}
+    for door in level.doors:
+        for num in door.switches:
+            if num not in switches:
+                raise ValueError("Door {} waits for switch {}, which is not "
+                                 "in the level!".format(door.num, num))
+    return level
+
+
+def compileLevel(source):
+    """
+    Compiles a level written as JSON into its binary form, baking the merged
+    walls and static platforms into colliders.
+
+    :param source: Dictionary, containing the level written as JSON.
+    :return: Bytes, containing the compiled level.
+    """
+    level = parseLevel(source)
+    level.colliders = bakeColliders(level)
+    return encodeLevel(level)
+
+
+def bakeColliders(level):
+    """
+    Merges the walls and static platforms of a level into the fewest solid
+    colliders covering them.
+
+    The walls and static platforms are built to measure them, hence the
+    game assets must be loaded (i.e. pygame initialised with a display).
+
+    :param level: Level instance, representing the level.
+    :return: List, containing ColliderData records.
+    """
+    import pygame as pg
+
+    from xcape.common.scene import BaseScene
+    from xcape.common.spatial import mergeRects
+
+    scene = BaseScene(pg.display.get_surface())
+    rects = []
+    for kind in ["walls", "sPlatforms"]:
+        for data in getattr(level, kind):
+            _, entity = scene.buildEntity(kind, data)
+            rects.append(entity.rect)
+
+    return [ColliderData(*rect, layer=LAYERS.index("solid"))
+            for rect in mergeRects(rects)]
+
+
+def encodeLevel(level):
+    """
+    Converts a level into its binary form.
+
+    :param level: Level instance, representing the level.
+    :return: Bytes, containing the compiled level.
+    """
+    strings = []
+    stringToIndex = {}
+    imageSets = []
+    imageSetToIndex = {}
+    switches = []
+
+    def stringIndex(string):
+        if string not in stringToIndex:
+            stringToIndex[string] = len(strings)
+            strings.append(string)
+        return stringToIndex[string]
+
+    def imageSetIndex(paths):
+        if paths not in imageSetToIndex:
+            imageSetToIndex[paths] = len(imageSets)
+            imageSets.append([stringIndex(p) for p in paths])
+        return imageSetToIndex[paths]
+
+    records = bytearray()
+    for kind, (Data, layout) in RECORDS.items():
+        entities = getattr(level, kind)
+        records += _COUNT.pack(len(entities))
+
+        for entity in entities:
+            fields = []
+            for name, value in zip(Data._fields, entity):
+                if name == "images":
+                    fields.append(imageSetIndex(value))
+                elif name == "orientation":
+                    fields.append(ORIENTATIONS.index(value))
+                elif name == "switches":
+                    fields += [len(switches), len(value)]
+                    switches += value
+                else:
+                    fields.append(value)
+            records += layout.pack(*fields)
+
+    data = bytearray(_HEADER.pack(MAGIC, VERSION))
+    data += _COUNT.pack(len(strings))
+    for string in strings:
+        encoded = string.encode("utf-8")
+        data += _STRING.pack(len(encoded)) + encoded
+
+    data += _COUNT.pack(len(imageSets))
+    for indices in imageSets:
+        data += _COUNT.pack(len(indices))
+        data += b"".join(_INDEX.pack(i) for i in indices)
+
+    data += _COUNT.pack(len(switches))
+    data += b"".join(_INDEX.pack(num) for num in switches)
+    return bytes(data + records)
+
+
+def decodeLevel(data):
+    """
+    Converts a compiled level back into a level.
+
+    :param data: Bytes, containing the compiled level.
+    :return: Level instance, representing the level.
+    """
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("The data is not a compiled level of version {}!"
+                         .format(VERSION))
+    offset = _HEADER.size
+
+    def count():
+        nonlocal offset
+        n, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        return n
+
+    def indices(n):
+        nonlocal offset
+        values = struct.unpack_from("<{}H".format(n), data, offset)
+        offset += n*_INDEX.size
+        return values
+
+    strings = []
+    for _ in range(count()):
+        length, = _STRING.unpack_from(data, offset)
+        offset += _STRING.size
+        strings.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    imageSets = [tuple(strings[i] for i in indices(count()))
+                 for _ in range(count())]
+    switches = indices(count())
+
+    level = Level()
+    for kind, (Data, layout) in RECORDS.items():
+        entities = getattr(level, kind)
+        n = count()
+
+        for fields in layout.iter_unpack(data[offset:offset + n*layout.size]):
+            values = []
+            fields = iter(fields)
+            for name in Data._fields:
+                value = next(fields)
+                if name == "images":
+                    value = imageSets[value]
+                elif name == "orientation":
+                    value = ORIENTATIONS[value]
+                elif name == "switches":
+                    value = switches[value:value + next(fields)]
+                values.append(value)
+            entities.append(Data(*values))
+        offset += n*layout.size
+    return level
+
+
+def loadLevel(name):
+    """
+    Loads a compiled level from the levels directory, which is only read
+    the first time the level is loaded.
+
+    :param name: String, the name of the level (i.e. its file name without
+    the extension).
+    :return: Level instance, representing the level.
+    """
+    try:
+        return _nameToLevel[name]
+    except KeyError:
+        pass
+
+    with open(os.path.join(_LEVELS_PATH, name + _EXTENSION), "rb") as file:
+        _nameToLevel[name] = decodeLevel(file.read())
+    return _nameToLevel[name]
+
+
+def main(paths):
+    """
+    Compiles the given levels written as JSON, saving each compiled level
+    next to it.
+
+    :param paths: List, containing the paths to the JSON files.
+    """
+    import json
+
+    import xcape.engines.headless   # Loads the game assets without a window
+
+    for path in paths:
+        with open(path) as file:
+            data = compileLevel(json.load(file))
+
+        output = os.path.splitext(path)[0] + _EXTENSION
+        with open(output, "wb") as file:
+            file.write(data)
+        print("Compiled '{}' into '{}' ({} bytes)".format(path, output,
+                                                         len(data)))
+
+
+if __name__ == "__main__":
+    import sys
+    main(sys.argv[1:])
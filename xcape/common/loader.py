@@ -114,3 +114,35 @@ ZONE1_RESOURCES = loadAnimations(_ZONE1_PATH)
 ZONE2_RESOURCES = loadAnimations(_ZONE2_PATH)
 CUTSCENE_RESOURCES = loadAnimations(_CUTSCENES_PATH)
 CHARACTER_RESOURCES = loadAnimations(_CHARACTERS_PATH)
+
+_ROOT_TO_RESOURCES = {
+    "icons": ICON_RESOURCES,
+    "menus": MENU_RESOURCES,
+    "zone1": ZONE1_RESOURCES,
+    "zone2": ZONE2_RESOURCES,
+    "cutscenes": CUTSCENE_RESOURCES,
+    "characters": CHARACTER_RESOURCES,
+}
+
+
+def findImage(path):
+    """
+    Finds a loaded animation or image by its path, which names the resources
+    followed by the subdirectory and animation directory (e.g.
+    'zone1/walls/boundary_left'), and optionally the index of an image within
+    the animation (e.g. 'zone1/walls/block_left/0').
+
+    :param path: String, the path of the animation or image.
+    :return: List, containing pygame.Surface objects of the animation, or the
+    pygame.Surface of the image if an index is given.
+    """
+    parts = path.split("/")
+    try:
+        root, subDir, animationDir = parts[:3]
+        animation = _ROOT_TO_RESOURCES[root][subDir][animationDir]
+        if len(parts) == 3:
+            return animation
+        index, = parts[3:]
+        return animation[int(index)]
+    except (KeyError, IndexError, ValueError):
+        raise ValueError("'{}' is not a valid path of an image!".format(path))
@@ -12,6 +12,10 @@ class GameObject:
     The base class for all other classes.
     """
 
+    # Allows subclasses to declare slots (subclasses without them still have
+    # an instance dictionary as usual).
+    __slots__ = ()
+
     MENU_EVENT = pg.USEREVENT + 1
     SCENE_EVENT = pg.USEREVENT + 2
     CUTSCENE_EVENT = pg.USEREVENT + 3
@@ -0,0 +1,112 @@
+"""
+Responsible for collecting performance statistics of the game.
+
+The statistics are only collected while the profiler is enabled, so that it
+can be left in production builds at the cost of a single flag check.
+"""
+
+import time
+from collections import deque
+
+
+class Profiler:
+    """
+    Collects frame times, section timings and counters for each frame.
+
+    The units for the timings are in milliseconds.
+    """
+
+    def __init__(self, historyLength=120):
+        """
+        :param historyLength: Integer, the number of frame times to remember.
+        """
+        self.isEnabled = False
+        self.frameTimes = deque(maxlen=historyLength)
+
+        # Statistics of the frame currently being collected
+        self.timings = {}
+        self.counters = {}
+        self.blits = {}
+
+        # Statistics of the last completed frame
+        self.lastTimings = {}
+        self.lastCounters = {}
+        self.lastBlits = {}
+
+    def toggle(self):
+        """
+        Switches the collection of statistics on or off.
+        """
+        self.isEnabled = not self.isEnabled
+        self.reset()
+
+    def reset(self):
+        """
+        Discards all the collected statistics.
+        """
+        self.frameTimes.clear()
+        self.timings = {}
+        self.counters = {}
+        self.blits = {}
+        self.lastTimings = {}
+        self.lastCounters = {}
+        self.lastBlits = {}
+
+    def timed(self, name, function):
+        """
+        Calls the given function and records how long it took to run.
+
+        :param name: String, the name of the section being timed.
+        :param function: Function, taking no arguments to be called.
+        """
+        if not self.isEnabled:
+            return function()
+
+        start = time.perf_counter()
+        result = function()
+        self.timings[name] = 1000*(time.perf_counter() - start)
+        return result
+
+    def count(self, name, amount=1):
+        """
+        Increments the counter of the given name.
+
+        :param name: String, the name of the counter.
+        :param amount: Integer, the amount to increment by.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def countBlit(self, gameObject):
+        """
+        Increments the number of blits issued by the type of the game object.
+
+        :param gameObject: GameObject instance, the object that was drawn.
+        """
+        name = type(gameObject).__name__
+        self.blits[name] = self.blits.get(name, 0) + 1
+
+    def endFrame(self, frameTime):
+        """
+        Completes the current frame, making its statistics available.
+
+        :param frameTime: Number, the milliseconds the frame took.
+        """
+        if not self.isEnabled:
+            return
+
+        self.frameTimes.append(frameTime)
+        self.lastTimings, self.timings = self.timings, {}
+        self.lastCounters, self.counters = self.counters, {}
+        self.lastBlits, self.blits = self.blits, {}
+
+    @property
+    def fps(self):
+        """
+        :return: Number, the average frames per second over the history.
+        """
+        if not self.frameTimes or sum(self.frameTimes) == 0:
+            return 0.0
+        return 1000*len(self.frameTimes)/sum(self.frameTimes)
+
+
+PROFILER = Profiler()
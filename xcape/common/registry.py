@@ -0,0 +1,269 @@
+"""
+Responsible for storing the entities of a scene by what they need each frame.
+"""
+
+import bisect
+from collections import OrderedDict, namedtuple
+
+import pygame as pg
+
+# Where an entity is updated: only while within the given distance in pixels
+# of the view of the camera or of a player (or wherever it is if the radius
+# is None)
+UpdateTier = namedtuple("UpdateTier", "radius")
+
+EVERYWHERE = UpdateTier(radius=None)
+
+
+class EntityRegistry:
+    """
+    Stores the entities of a scene by archetype, i.e. by the kind of work
+    they need every frame, and runs a single update and draw loop over them.
+
+    static:         Entities that never change (e.g. walls and platforms).
+    animated:       Entities with animations or sounds (e.g. switches).
+    physics:        Entities driven by physics (e.g. players).
+    ai:             Entities driven by an AI (e.g. bosses).
+
+    Entities marked as static when they were built (i.e. with a single frame
+    to render and no physics, see their isStatic attribute) are only drawn,
+    and never updated. In large levels these are most of the entities.
+
+    The other entities are updated archetype by archetype, and all entities
+    are drawn kind by kind in the given draw order (DRAW_ORDER by default)
+    so that e.g. the players are always drawn in front of the level.
+    Entities of the same kind are updated and drawn in the order they were
+    added.
+
+    Within an archetype, entities are further grouped by the update tier they
+    declare (see their UPDATE_TIER attribute, everywhere by default), so
+    that e.g. moving platforms far from the camera are not updated at all.
+    An entity leaving the range of its tier is suspended (see its optional
+    suspend and resume methods) until it comes back into range, and is then
+    given the times of the frames it missed so that it can catch up on them.
+    The range is measured from the rect of the entity, or from the whole
+    area it can cover while suspended (see its optional reach attribute).
+    Until the scene is told where the camera is (see focus), every entity is
+    in range.
+
+    Entities in view are updated every frame, since any frame they skipped
+    would be drawn out of date.
+    """
+
+    ARCHETYPES = [
+        "static",
+        "animated",
+        "physics",
+        "ai",
+    ]
+
+    # The archetype of each kind of entity, unless it is marked as static
+    GROUP_ARCHETYPES = {
+        "decorations": "animated",
+        "walls": "animated",
+        "sPlatforms": "animated",
+        "dPlatforms": "animated",
+        "spikes": "animated",
+        "switches": "animated",
+        "doors": "animated",
+        "mPlatforms": "physics",
+        "players": "physics",
+        "bosses": "ai",
+    }
+
+    # The order in which the archetypes are updated (the static entities
+    # have nothing to update)
+    UPDATE_ORDER = [
+        "animated",
+        "physics",
+        "ai",
+    ]
+
+    # The default order in which the kinds of entities are drawn, back to
+    # front
+    DRAW_ORDER = [
+        "decorations",
+        "walls",
+        "switches",
+        "doors",
+        "spikes",
+        "sPlatforms",
+        "dPlatforms",
+        "mPlatforms",
+        "players",
+        "bosses",
+    ]
+
+    # The number of frame times kept before the first trim
+    MIN_TICKS = 1024
+
+    def __init__(self, drawOrder=None):
+        """
+        :param drawOrder: List, containing every kind of entity in the order
+        they are drawn (back to front), or None for DRAW_ORDER.
+        """
+        self.drawOrder = drawOrder or self.DRAW_ORDER
+        if sorted(self.drawOrder) != sorted(self.GROUP_ARCHETYPES):
+            raise ValueError("The draw order must contain every kind of "
+                             "entity once! The kinds are {}!"
+                             .format(list(self.GROUP_ARCHETYPES)))
+
+        self.archetypeToEntities = {a: [] for a in self.ARCHETYPES}
+        self.groupToEntities = {g: [] for g in self.drawOrder}
+        self.groupToDepths = {g: [] for g in self.drawOrder}
+        self.entityToGroup = {}
+        self.entityToArchetype = {}
+
+        self.archetypeToTiers = {a: OrderedDict() for a in self.ARCHETYPES}
+        self.entityToTier = {}
+        self.areas = []
+        self.frame = 0
+
+        # The frame each suspended entity was suspended at, and the times of
+        # the frames since the oldest of them (the first at tickFrame)
+        self.suspended = {}
+        self.ticks = []
+        self.tickFrame = 1
+        self.trimAt = self.MIN_TICKS
+
+    def __len__(self):
+        return len(self.entityToGroup)
+
+    def __contains__(self, entity):
+        return entity in self.entityToGroup
+
+    def update(self):
+        """
+        Updates every entity that is not static and is within the range of
+        its tier.
+        """
+        self.frame += 1
+        self.ticks.append(pg.time.get_ticks())
+
+        for archetype in self.UPDATE_ORDER:
+            for tier, entities in self.archetypeToTiers[archetype].items():
+                if tier.radius is None or not self.areas:
+                    for entity in entities:
+                        entity.update()
+                else:
+                    self._updateInRange(tier, entities)
+
+        self._trimTicks()
+
+    def focus(self, areas):
+        """
+        Sets the areas that the range of the update tiers is measured from.
+
+        :param areas: List, containing pygame.Rect objects of the areas (e.g.
+        the view of the camera and the rects of the players).
+        """
+        self.areas = areas
+
+    def draw(self, camera=None):
+        """
+        Draws every entity in the draw order.
+
+        :param camera: SimpleCamera instance, the camera to draw with.
+        """
+        for group in self.drawOrder:
+            for entity in self.groupToEntities[group]:
+                entity.draw(camera)
+
+    def add(self, entity, group, depth=None):
+        """
+        Adds an entity to be updated and drawn.
+
+        :param entity: GameObject instance, representing the entity.
+        :param group: String, the kind of entity (e.g. 'walls').
+        :param depth: Number, where the entity is drawn among the entities of
+        its kind (lower depths are drawn first), or None to draw it in front
+        of all of them.
+        """
+        try:
+            archetype = self.GROUP_ARCHETYPES[group]
+        except KeyError:
+            raise KeyError("'{}' is an invalid kind of entity! The kinds "
+                           "allowed are {}!"
+                           .format(group, list(self.GROUP_ARCHETYPES)))
+
+        if getattr(entity, "isStatic", False):
+            archetype = "static"
+
+        self.entityToGroup[entity] = group
+        self.entityToArchetype[entity] = archetype
+        self.archetypeToEntities[archetype].append(entity)
+
+        tier = getattr(entity, "UPDATE_TIER", EVERYWHERE)
+        self.entityToTier[entity] = tier
+        self.archetypeToTiers[archetype].setdefault(tier, []).append(entity)
+
+        if depth is None:
+            depth = float("inf")
+        depths = self.groupToDepths[group]
+        i = bisect.bisect_right(depths, depth)
+        depths.insert(i, depth)
+        self.groupToEntities[group].insert(i, entity)
+
+    def remove(self, entity):
+        """
+        Removes an entity so that it is no longer updated or drawn.
+
+        :param entity: GameObject instance, previously added.
+        """
+        group = self.entityToGroup.pop(entity)
+        archetype = self.entityToArchetype.pop(entity)
+        self.archetypeToEntities[archetype].remove(entity)
+        tier = self.entityToTier.pop(entity)
+        self.archetypeToTiers[archetype][tier].remove(entity)
+        self.suspended.pop(entity, None)
+
+        entities = self.groupToEntities[group]
+        i = entities.index(entity)
+        del entities[i]
+        del self.groupToDepths[group][i]
+
+    def _updateInRange(self, tier, entities):
+        """
+        Updates the entities within the range of their tier, suspending the
+        entities that have left it and resuming those that have come back.
+
+        :param tier: UpdateTier instance, the tier of the entities.
+        :param entities: List, containing the entities of the tier.
+        """
+        d = 2*tier.radius
+        areas = [area.inflate(d, d) for area in self.areas]
+
+        for entity in entities:
+            rect = getattr(entity, "reach", entity.rect)
+            if rect.collidelist(areas) == -1:
+                if entity not in self.suspended:
+                    self.suspended[entity] = self.frame
+                    if hasattr(entity, "suspend"):
+                        entity.suspend()
+                continue
+
+            if entity in self.suspended:
+                start = self.suspended.pop(entity) - self.tickFrame
+                missed = self.ticks[start:-1]
+                if hasattr(entity, "resume"):
+                    entity.resume(missed)
+            entity.update()
+
+    def _trimTicks(self):
+        """
+        Forgets the times of the frames that no suspended entity has missed.
+        """
+        if not self.suspended:
+            self.ticks = []
+            self.tickFrame = self.frame + 1
+            return
+
+        # Only looks for the oldest suspension once the times have doubled
+        # since the last trim, to keep its cost per frame low
+        if len(self.ticks) < self.trimAt:
+            return
+
+        oldest = min(self.suspended.values())
+        del self.ticks[:oldest - self.tickFrame]
+        self.tickFrame = oldest
+        self.trimAt = max(2*len(self.ticks), self.MIN_TICKS)
@@ -0,0 +1,76 @@
+"""
+Responsible for delivering events only to the objects interested in them.
+"""
+
+import pygame as pg
+
+
+class EventRouter:
+    """
+    Delivers each event to the handlers subscribed to its type and, for
+    keyboard events, to the handlers subscribed to the key pressed or
+    released, rather than to every object which would ignore most of them.
+
+    A handler subscribed to a type without any keys receives every event of
+    that type. Handlers receive the events in the order they subscribed,
+    where the handlers of every key come before the handlers of a single key.
+    """
+
+    KEY_EVENTS = (pg.KEYDOWN, pg.KEYUP)
+
+    def __init__(self):
+        # The handlers of each (type, key) pair, where the key is None for
+        # the handlers of every event of the type
+        self.routeToHandlers = {}
+
+    def __len__(self):
+        return sum(len(h) for h in self.routeToHandlers.values())
+
+    def subscribe(self, handler, eventType, keys=None):
+        """
+        Subscribes a handler to the events of a type.
+
+        :param handler: Function, taking the event as its only argument (e.g.
+        the handleEvent method of a game object).
+        :param eventType: Integer, the type of the events (e.g. pg.KEYDOWN).
+        :param keys: List, containing the keys to subscribe to for keyboard
+        events, or None to subscribe to every key.
+        """
+        if keys is not None and eventType not in self.KEY_EVENTS:
+            raise ValueError("Only keyboard events can be subscribed to by "
+                             "key!")
+
+        for key in keys if keys is not None else [None]:
+            handlers = self.routeToHandlers.setdefault((eventType, key), [])
+            if handler not in handlers:
+                handlers.append(handler)
+
+    def unsubscribe(self, handler, eventType=None):
+        """
+        Unsubscribes a handler from every event it was subscribed to.
+
+        :param handler: Function, previously subscribed.
+        :param eventType: Integer, the only type of the events to unsubscribe
+        from (e.g. pg.KEYDOWN), or None to unsubscribe from every type.
+        """
+        for route, handlers in list(self.routeToHandlers.items()):
+            if eventType is not None and route[0] != eventType:
+                continue
+            if handler in handlers:
+                handlers.remove(handler)
+                if not handlers:
+                    del self.routeToHandlers[route]
+
+    def route(self, event):
+        """
+        Delivers an event to the handlers subscribed to it.
+
+        :param event: pygame.Event, the event to deliver.
+        """
+        # Copied since a handler may unsubscribe while handling the event
+        handlers = list(self.routeToHandlers.get((event.type, None), []))
+        if event.type in self.KEY_EVENTS:
+            handlers += self.routeToHandlers.get((event.type, event.key), [])
+
+        for handler in handlers:
+            handler(event)
@@ -2,9 +2,23 @@
 Contains the base class for a scene for both single and multiplayer levels.
 """
 
+import math
+
 import pygame as pg
+from pygame.math import Vector2
 
+from xcape.common.level import LAYERS, RECORDS
+from xcape.common.loader import findImage
 from xcape.common.object import GameObject
+from xcape.common.registry import EntityRegistry
+from xcape.common.router import EventRouter
+from xcape.common.spatial import computeRayEntry
+from xcape.common.streaming import ChunkStreamer
+from xcape.entities.bosses import PigBoss
+from xcape.entities.players import PlayerOne, PlayerTwo
+from xcape.entities.scene import (
+    Wall, SPlatform, DPlatform, MPlatform, Switch, Door, Spike, Decoration, Spear
+)
 
 
 class BaseScene(GameObject):
@@ -12,6 +26,20 @@ class BaseScene(GameObject):
     The base scene for any scene.
     """
 
+    # The entities whose state changes while playing, which are captured by
+    # a snapshot of the scene (the other entities never change)
+    SNAPSHOT_GROUPS = [
+        "players",
+        "bosses",
+        "mPlatforms",
+        "switches",
+        "doors",
+    ]
+
+    # The order in which the kinds of entities are drawn, back to front,
+    # which scenes override where their entities overlap differently
+    DRAW_ORDER = EntityRegistry.DRAW_ORDER
+
     def __init__(self, screen):
         """
         :param screen: pygame.Surface, representing the screen.
@@ -33,8 +61,25 @@ class BaseScene(GameObject):
         self.spears = []
         self.decorations = []
 
+        # The merged walls and static platforms if they were baked into the
+        # level, otherwise they are merged by the collision engine
+        self.solids = None
+
+        # Updates and draws the entities once they have been registered, and
+        # delivers them the events they have subscribed to
+        self.registry = EntityRegistry(self.DRAW_ORDER)
+        self.router = EventRouter()
+
+        # Loads the entities near the players if the level is streamed
+        self.streamer = None
+
+        # Finds the entities by position once attached (see queryRect)
+        self.collisionEngine = None
+
+        self._snapshot = []
+
     def handleEvent(self, event):
-        pass
+        self.router.route(event)
 
     def update(self):
         raise NotImplementedError
@@ -42,90 +87,311 @@ class BaseScene(GameObject):
     def draw(self, camera=None):
         raise NotImplementedError
 
-    def addPlayers(self):
+    def registerEntities(self):
+        """
+        Registers all the entities of the scene, so that they are updated and
+        drawn along with the scene, and receive the events they subscribe to
+        (see their optional subscribe method).
         """
-        Adds players to the scene.
+        self.registry = EntityRegistry(self.DRAW_ORDER)
+        self.router = EventRouter()
+        for group in self.DRAW_ORDER:
+            for entity in getattr(self, group):
+                self.registry.add(entity, group)
+                if hasattr(entity, "subscribe"):
+                    entity.subscribe(self.router)
 
-        :return: List, containing enemy entities.
+    def snapshot(self):
         """
-        raise NotImplementedError
+        Captures the current state of the scene (i.e. of the entities that
+        change while playing), which the scene can be reset to later on.
+        """
+        groups = self.SNAPSHOT_GROUPS
+        if self.streamer:
+            groups = [g for g in groups
+                      if g not in ChunkStreamer.STREAMED_KINDS]
 
-    def addBosses(self):
+        self._snapshot = [(entity, entity.snapshot())
+                          for name in groups
+                          for entity in getattr(self, name)]
+
+    def reset(self):
         """
-        Adds players to the scene.
+        Resets the scene in place to the state captured by the last snapshot
+        (e.g. when restarting the level), which is much faster than building
+        the scene again.
 
-        :return: List, containing enemy entities.
+        The chunks of a streamed level are all unloaded instead, so that they
+        are loaded as they were at the start of the level.
         """
-        raise NotImplementedError
+        for entity, state in self._snapshot:
+            entity.reset(state)
+        if self.streamer:
+            self.streamer.reset()
+
+        self.elapsed = 0
+        self.origin = pg.time.get_ticks()
 
-    def addWalls(self):
+    def addLevel(self, level, isStreamed=None):
         """
-        Adds walls to the scene.
+        Adds all the entities of a level to the scene, where every boss hunts
+        the players of the level.
 
-        :return: List, containing wall entities.
+        Large levels are streamed instead (see ChunkStreamer), where only the
+        players, bosses, moving platforms and doors are added straight away.
+
+        :param level: Level instance, representing the level.
+        :param isStreamed: Boolean, whether to stream the level, or None to
+        stream it only if it is large.
         """
-        raise NotImplementedError
+        if isStreamed is None:
+            isStreamed = ChunkStreamer.isLarge(level)
+        if isStreamed:
+            self.streamer = ChunkStreamer(self, level)
+            self.solids = []
+
+        for kind in RECORDS:
+            if kind == "colliders":
+                continue
+            if self.streamer and kind in ChunkStreamer.STREAMED_KINDS:
+                continue
+
+            for data in getattr(level, kind):
+                group, entity = self.buildEntity(kind, data)
+                getattr(self, group).append(entity)
 
-    def addSPlatforms(self):
+        if level.colliders and not self.streamer:
+            self.solids = [pg.Rect(c.x, c.y, c.w, c.h)
+                           for c in level.colliders
+                           if LAYERS[c.layer] == "solid"]
+
+        self.registerEntities()
+
+    def buildEntity(self, kind, data):
         """
-        Adds static platforms to the scene.
+        Builds the entity of a record of a level.
 
-        :return: List, containing platform entities.
+        :param kind: String, the kind of record (see level.RECORDS).
+        :param data: Namedtuple, the record of the entity.
+        :return: 2-Tuple, containing the name of the list of the scene the
+        entity belongs to, and the entity.
         """
-        raise NotImplementedError
+        # Players past the second (e.g. in generated levels) take turns being
+        # either character, sharing its keys
+        if kind == "players":
+            Player = PlayerOne if data.num % 2 else PlayerTwo
+            player = Player(self.screen)
+            player.num = data.num
+            player.rect.center = (data.x, data.y)
+            return kind, player
+
+        if kind == "bosses":
+            boss = PigBoss(self.screen)
+            boss.rect.center = (data.x, data.y)
+            boss.target(self.players, self)
+            return kind, boss
+
+        if kind == "walls":
+            images = self._findImages(data.images)
+            return kind, Wall(data.x, data.y, data.blocks, data.orientation,
+                              images, self.screen)
+
+        if kind == "sPlatforms":
+            return kind, SPlatform(data.x, data.y, data.blocks, self.screen,
+                                   data.zone)
+
+        if kind == "dPlatforms":
+            return kind, DPlatform(data.x, data.y, data.blocks, self.screen,
+                                   data.zone)
+
+        if kind == "mPlatforms":
+            image = findImage(data.images[0])
+            return kind, MPlatform((data.ax, data.ay), (data.bx, data.by),
+                                   data.dx, data.dy, self.screen, image)
+
+        if kind == "switches":
+            return kind, Switch(data.x, data.y, data.num, self.screen,
+                                data.zone)
 
-    def addMPlatforms(self):
+        if kind == "doors":
+            door = Door(data.x, data.y, data.num, self.screen, data.zone)
+            door.switchesWaiting = list(data.switches)
+            return kind, door
+
+        if kind == "spikes":
+            image = findImage(data.images[0])
+            return kind, Spike(data.x, data.y, data.blocks, data.orientation,
+                               image, self.screen)
+
+        # Spears are as deadly as spikes, hence collide as spikes
+        if kind == "spears":
+            return "spikes", Spear(data.x, data.y, self.screen)
+
+        if kind == "decorations":
+            image = findImage(data.images[0])
+            return kind, Decoration(data.x, data.y, image, self.screen)
+
+        raise ValueError("'{}' is an invalid kind of entity! The kinds allowed "
+                         "are {}!".format(kind, list(RECORDS)))
+
+    def addEntity(self, entity, group, depth=None):
         """
-        Adds moving platforms to the scene.
+        Adds an entity to a scene that has already been filled (e.g. when
+        loading a chunk of a streamed level).
 
-        :return: List, containing platform entities.
+        :param entity: GameObject instance, representing the entity.
+        :param group: String, the name of the list of the scene to add to.
+        :param depth: Number, where the entity is drawn among the entities of
+        its kind, or None to draw it in front of all of them.
         """
-        raise NotImplementedError
+        getattr(self, group).append(entity)
+        self.registry.add(entity, group, depth)
+        if hasattr(entity, "subscribe"):
+            entity.subscribe(self.router)
 
-    def addDPlatforms(self):
+    def removeEntity(self, entity, group):
         """
-        Adds directional platforms to the scene.
+        Removes an entity previously added to the scene.
 
-        :return: List, containing platform entities.
+        :param entity: GameObject instance, representing the entity.
+        :param group: String, the name of the list of the scene it is in.
         """
-        raise NotImplementedError
+        getattr(self, group).remove(entity)
+        self.registry.remove(entity)
+        if hasattr(entity, "subscribe"):
+            self.router.unsubscribe(entity.handleEvent)
 
-    def addDoors(self):
+    def focus(self, camera):
         """
-        Adds doors to the scene.
+        Tells the scene where the camera and the players are, which loads the
+        chunks of a streamed level near them (unloading the chunks far from
+        them), and sets the range that the entities are updated in.
 
-        :return: List, containing door entities.
+        :param camera: SimpleCamera instance, the camera showing the scene.
         """
-        raise NotImplementedError
+        x, y = camera.rect.topleft
+        view = pg.Rect(-x, -y, camera.WIDTH, camera.HEIGHT)
+        areas = [view] + [p.rect for p in self.players]
+
+        if self.streamer:
+            self.streamer.update(areas)
+        self.registry.focus(areas)
 
-    def addSwitches(self):
+    def queryRect(self, rect, groups=None):
         """
-        Adds buttons to the scene.
+        Finds all the entities that collide with an area.
 
-        :return: List, containing button entities.
+        The entities are found through the collision engine of the scene, so
+        they are of its kinds, where the walls and static platforms are found
+        as the 'solids' covering them (see CollisionEngine.GROUP_LAYERS). The
+        entities that never move are found through its spatial hash, and are
+        returned first, in the order they were added.
+
+        :param rect: pygame.Rect, the area to search.
+        :param groups: List, containing the kinds of entities to find (e.g.
+        'doors' or 'players'), or None to find any.
+        :return: List, containing the entities colliding with the area.
         """
-        raise NotImplementedError
+        engine = self._findCollisionEngine()
+        hits = [e for e in engine.grid.query(rect)
+                if groups is None or engine.entityToGroup[e] in groups]
 
-    def addSpikes(self):
+        for group in self._findDynamicGroups(groups):
+            hits += [e for e in getattr(self, group)
+                     if rect.colliderect(e.rect)]
+        return hits
+
+    def queryRadius(self, point, radius, groups=None):
         """
-        Adds spikes to the scene.
+        Finds all the entities whose rects are within a distance of a point.
 
-        :return: List, containing enemy entities.
+        :param point: 2-Tuple, containing the x and y coordinates.
+        :param radius: Number, the distance around the point to search.
+        :param groups: List, containing the kinds of entities to find, or
+        None to find any (see queryRect).
+        :return: List, containing the entities within the distance.
         """
-        raise NotImplementedError
+        x, y = point
+        left = int(math.floor(x - radius))
+        top = int(math.floor(y - radius))
+        right = int(math.ceil(x + radius)) + 1
+        bottom = int(math.ceil(y + radius)) + 1
+        area = pg.Rect(left, top, right - left, bottom - top)
+
+        hits = []
+        for entity in self.queryRect(area, groups):
+            rect = entity.rect
+            dx = x - min(max(x, rect.left), rect.right)
+            dy = y - min(max(y, rect.top), rect.bottom)
+            if dx*dx + dy*dy <= radius*radius:
+                hits.append(entity)
+        return hits
 
-    def addDecorations(self):
+    def raycast(self, origin, direction, maxDist, groups=None):
         """
-        Adds decorations to the scene.
+        Finds the first entity hit by a ray.
 
-        :return: List, containing decoration entities.
+        :param origin: 2-Tuple, containing the x and y coordinates the ray
+        starts from.
+        :param direction: 2-Tuple, the direction of the ray (of any length
+        other than zero).
+        :param maxDist: Number, the furthest distance the ray reaches.
+        :param groups: List, containing the kinds of entities to hit, or None
+        to hit any (see queryRect).
+        :return: 3-Tuple, containing the entity hit, the point where it was
+        hit and the distance to that point, or None if nothing was hit.
         """
-        raise NotImplementedError
+        engine = self._findCollisionEngine()
+        direction = tuple(Vector2(direction).normalize())
+
+        def isWanted(entity):
+            return groups is None or engine.entityToGroup[entity] in groups
+
+        hit = engine.grid.raycast(origin, direction, maxDist, isWanted)
+        best = (hit[2], hit[0]) if hit else None
+
+        for group in self._findDynamicGroups(groups):
+            for entity in getattr(self, group):
+                entry = computeRayEntry(origin, direction, entity.rect)
+                if (entry is not None and entry <= maxDist and
+                        (not best or entry < best[0])):
+                    best = (entry, entity)
 
-    def addSpears(self):
+        if not best:
+            return None
+
+        entry, entity = best
+        x, y = origin
+        dx, dy = direction
+        return entity, (x + dx*entry, y + dy*entry), entry
+
+    def _findCollisionEngine(self):
+        """
+        :return: CollisionEngine instance, attached to the scene.
         """
-        Adds spears to the scene.
+        if not self.collisionEngine:
+            raise ValueError("'{}' cannot find its entities by position "
+                             "before a collision engine is attached!"
+                             .format(self))
+        return self.collisionEngine
 
-        :return: List, containing enemy entities.
+    def _findDynamicGroups(self, groups):
         """
-        raise NotImplementedError
+        :param groups: List, containing the kinds of entities, or None for
+        any kind.
+        :return: List, containing the kinds of entities that move among them.
+        """
+        return [g for g in self.collisionEngine.DYNAMIC_GROUPS
+                if groups is None or g in groups]
+
+    def _findImages(self, paths):
+        """
+        Finds the images of a wall, i.e. either a single animation or the
+        three images it is built from.
+
+        :param paths: Tuple, containing the paths of the images.
+        :return: List, containing pygame.Surface objects.
+        """
+        if len(paths) == 1:
+            return findImage(paths[0])
+        return [findImage(path) for path in paths]
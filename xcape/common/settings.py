@@ -6,6 +6,9 @@ import pygame as pg
 WIDTH = 640
 HEIGHT = 480
 FPS = 70
+# Physics is stepped at a fixed rate that is independent of the FPS.
+# Increasing the rate too much can cause choppiness!
+PHYSICS_FPS = 35
 TITLE = "Prison Xcape"
 
 # Defaults to pygame's default font which supports various
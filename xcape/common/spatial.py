@@ -0,0 +1,342 @@
+"""
+Responsible for finding game objects by their position quickly.
+"""
+
+import pygame as pg
+
+
+class SpatialHash:
+    """
+    A uniform grid which buckets game objects by the cells that their rects
+    cover, so that only the game objects near an area need to be tested for
+    collisions with it (instead of every game object in a scene).
+
+    The game objects found are always returned in the order they were added,
+    which keeps collisions resolved in the same order as iterating through
+    the original list of game objects.
+    """
+
+    def __init__(self, gameObjects=(), cellSize=64):
+        """
+        :param gameObjects: List, containing GameObject instances to add.
+        :param cellSize: Integer, the width and height of a cell in pixels.
+        """
+        self.cellSize = cellSize
+        self.cells = {}
+
+        # Remembers where each game object was bucketed, and in what order
+        self.objectToRect = {}
+        self.objectToCells = {}
+        self.objectToOrder = {}
+        self._added = 0
+
+        # The number of game objects tested by the last query
+        self.lastChecked = 0
+
+        for gameObject in gameObjects:
+            self.add(gameObject)
+
+    def __len__(self):
+        return len(self.objectToOrder)
+
+    def add(self, gameObject):
+        """
+        Adds a game object to the cells covered by its rect.
+
+        :param gameObject: GameObject instance, having a rect attribute.
+        """
+        self.objectToOrder[gameObject] = self._added
+        self._added += 1
+        self._bucket(gameObject)
+
+    def remove(self, gameObject):
+        """
+        Removes a game object from all the cells it was bucketed in.
+
+        :param gameObject: GameObject instance, previously added.
+        """
+        self._unbucket(gameObject)
+        del self.objectToOrder[gameObject]
+        del self.objectToRect[gameObject]
+
+    def move(self, gameObject):
+        """
+        Moves a game object to the cells now covered by its rect, which only
+        changes any buckets if it has moved into a different cell.
+
+        :param gameObject: GameObject instance, previously added.
+        """
+        rect = tuple(gameObject.rect)
+        if rect == self.objectToRect[gameObject]:
+            return
+
+        if self._computeCells(gameObject.rect) != self.objectToCells[gameObject]:
+            self._unbucket(gameObject)
+            self._bucket(gameObject)
+        else:
+            self.objectToRect[gameObject] = rect
+
+    def query(self, rect):
+        """
+        Finds all the game objects that collide with the given area.
+
+        :param rect: pygame.Rect, the area to search.
+        :return: List, containing the game objects colliding with the area.
+        """
+        size = self.cellSize
+        columns = range(rect.left // size, (rect.right - 1) // size + 1)
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+
+        hits = []
+        seen = set()
+        for i in columns:
+            for j in rows:
+                for gameObject in self.cells.get((i, j), ()):
+                    if gameObject not in seen:
+                        seen.add(gameObject)
+                        if rect.colliderect(gameObject.rect):
+                            hits.append(gameObject)
+
+        self.lastChecked = len(seen)
+        if len(hits) > 1:
+            hits.sort(key=self.objectToOrder.__getitem__)
+        return hits
+
+    def raycast(self, origin, direction, maxDist, isWanted=None):
+        """
+        Finds the first game object hit by a ray.
+
+        The ray walks through the cells in the order it passes through them,
+        and stops at the first cell beyond which nothing nearer can be hit,
+        so only the game objects along the ray are tested.
+
+        :param origin: 2-Tuple, containing the x and y coordinates the ray
+        starts from.
+        :param direction: 2-Tuple, the direction of the ray (of length one).
+        :param maxDist: Number, the furthest distance the ray reaches.
+        :param isWanted: Function, taking a game object and returning whether
+        it can be hit, or None if any can be hit.
+        :return: 3-Tuple, containing the game object hit, the point where it
+        was hit and the distance to that point, or None if nothing was hit.
+        """
+        x, y = origin
+        dx, dy = direction
+        size = self.cellSize
+
+        i, j = int(x // size), int(y // size)
+        stepI, nextX, deltaX = self._computeRaySteps(x, dx, i)
+        stepJ, nextY, deltaY = self._computeRaySteps(y, dy, j)
+
+        best = None
+        seen = set()
+        distance = 0
+        while distance <= maxDist:
+            for gameObject in self.cells.get((i, j), ()):
+                if gameObject in seen:
+                    continue
+                seen.add(gameObject)
+
+                if isWanted is None or isWanted(gameObject):
+                    entry = computeRayEntry(origin, direction, gameObject.rect)
+                    if (entry is not None and entry <= maxDist and
+                            (not best or entry < best[0])):
+                        best = (entry, gameObject)
+
+            # Anything hit beyond this cell is further than the exit of it
+            if best and best[0] <= min(nextX, nextY):
+                break
+
+            if nextX < nextY:
+                distance = nextX
+                nextX += deltaX
+                i += stepI
+            else:
+                distance = nextY
+                nextY += deltaY
+                j += stepJ
+
+        self.lastChecked = len(seen)
+        if not best:
+            return None
+
+        entry, gameObject = best
+        return gameObject, (x + dx*entry, y + dy*entry), entry
+
+    def _computeRaySteps(self, start, d, cell):
+        """
+        Computes how a ray steps through the cells along a single axis.
+
+        :param start: Number, the coordinate the ray starts from.
+        :param d: Number, the component of the direction of the ray.
+        :param cell: Integer, the index of the cell the ray starts in.
+        :return: 3-Tuple, containing the step between cell indices, the
+        distance at which the ray enters the next cell, and the distance the
+        ray travels to cross a whole cell.
+        """
+        size = self.cellSize
+        if d > 0:
+            return 1, ((cell + 1)*size - start)/d, size/d
+        if d < 0:
+            return -1, (cell*size - start)/d, -size/d
+        return 0, float("inf"), float("inf")
+
+    def _bucket(self, gameObject):
+        """
+        Adds a game object to the cells currently covered by its rect.
+
+        :param gameObject: GameObject instance, having a rect attribute.
+        """
+        cells = self._computeCells(gameObject.rect)
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(gameObject)
+
+        self.objectToRect[gameObject] = tuple(gameObject.rect)
+        self.objectToCells[gameObject] = cells
+
+    def _unbucket(self, gameObject):
+        """
+        Removes a game object from the cells it was last bucketed in.
+
+        :param gameObject: GameObject instance, previously added.
+        """
+        for cell in self.objectToCells.pop(gameObject):
+            bucket = self.cells[cell]
+            bucket.remove(gameObject)
+            if not bucket:
+                del self.cells[cell]
+
+    def _computeCells(self, rect):
+        """
+        Computes the cells covered by a rect (rects without an area do not
+        cover any cells).
+
+        :param rect: pygame.Rect, the area to compute the cells of.
+        :return: Tuple, containing the (column, row) of each cell.
+        """
+        size = self.cellSize
+        return tuple((i, j)
+                     for i in range(rect.left // size,
+                                    (rect.right - 1) // size + 1)
+                     for j in range(rect.top // size,
+                                    (rect.bottom - 1) // size + 1))
+
+
+def computeRayEntry(origin, direction, rect):
+    """
+    Computes the distance at which a ray enters a rect.
+
+    :param origin: 2-Tuple, containing the x and y coordinates the ray starts
+    from.
+    :param direction: 2-Tuple, the direction of the ray (of length one).
+    :param rect: pygame.Rect, the rect to test.
+    :return: Number, the distance along the ray (zero if it starts inside the
+    rect), or None if the ray misses the rect.
+    """
+    entry = 0.0
+    exit = float("inf")
+    for start, d, low, high in ((origin[0], direction[0],
+                                 rect.left, rect.right),
+                                (origin[1], direction[1],
+                                 rect.top, rect.bottom)):
+        if d == 0:
+            if not low <= start < high:
+                return None
+            continue
+
+        near = (low - start)/d
+        far = (high - start)/d
+        entry = max(entry, min(near, far))
+        exit = min(exit, max(near, far))
+        if entry > exit:
+            return None
+    return entry
+
+
+def sweepAndPrune(gameObjects, margin=0):
+    """
+    Finds all the pairs of game objects whose rects collide with each other.
+
+    The game objects are sorted along the x-axis and swept from left to
+    right, so that each game object is only tested against the game objects
+    whose extent along the x-axis it overlaps (instead of every other game
+    object).
+
+    :param gameObjects: List, containing GameObject instances.
+    :param margin: Integer, how far apart (in pixels) the rects can be while
+    still being paired.
+    :return: List, containing 2-tuples of colliding game objects, each in
+    the order of the given list.
+    """
+    order = {gameObject: i for i, gameObject in enumerate(gameObjects)}
+    objectToRect = {o: o.rect.inflate(margin, margin) for o in gameObjects}
+    pairs = []
+    active = []
+
+    for gameObject in sorted(gameObjects, key=lambda o: objectToRect[o].left):
+        rect = objectToRect[gameObject]
+        active = [other for other in active
+                  if objectToRect[other].right > rect.left]
+        for other in active:
+            if rect.colliderect(objectToRect[other]):
+                if order[other] < order[gameObject]:
+                    pairs.append((other, gameObject))
+                else:
+                    pairs.append((gameObject, other))
+        active.append(gameObject)
+
+    pairs.sort(key=lambda pair: (order[pair[0]], order[pair[1]]))
+    return pairs
+
+
+def mergeRects(rects):
+    """
+    Merges rects that touch or overlap into fewer rects covering exactly the
+    same area.
+
+    The area is swept from top to bottom in bands (between consecutive edges
+    of the rects). The rects crossing a band are merged into horizontal runs,
+    and each run is extended downwards for as long as the next band has an
+    identical run. Merging by rows first keeps floors and platforms whole,
+    which is what players stand and walk on.
+
+    :param rects: List, containing pygame.Rect instances.
+    :return: List, containing the merged pygame.Rect instances, ordered from
+    top to bottom then left to right.
+    """
+    rects = sorted((r for r in rects if r.width > 0 and r.height > 0),
+                   key=lambda r: r.top)
+    edges = sorted({r.top for r in rects} | {r.bottom for r in rects})
+
+    merged = []
+    runToTop = {}
+    active = []
+    index = 0
+
+    for top, bottom in zip(edges, edges[1:]):
+        while index < len(rects) and rects[index].top <= top:
+            active.append(rects[index])
+            index += 1
+        active = [r for r in active if r.bottom > top]
+
+        runs = []
+        for left, right in sorted((r.left, r.right) for r in active):
+            if runs and left <= runs[-1][1]:
+                runs[-1][1] = max(runs[-1][1], right)
+            else:
+                runs.append([left, right])
+        runs = [tuple(run) for run in runs]
+
+        # Closes the runs that do not continue into this band
+        for run in [run for run in runToTop if run not in runs]:
+            left, right = run
+            runTop = runToTop.pop(run)
+            merged.append(pg.Rect(left, runTop, right - left, top - runTop))
+
+        for run in runs:
+            runToTop.setdefault(run, top)
+
+    for (left, right), runTop in runToTop.items():
+        merged.append(pg.Rect(left, runTop, right - left, edges[-1] - runTop))
+
+    merged.sort(key=lambda r: (r.top, r.left))
+    return merged
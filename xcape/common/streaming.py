@@ -0,0 +1,230 @@
+"""
+Responsible for loading only the parts of a large level near the players.
+"""
+
+import pygame as pg
+
+from xcape.common.level import LAYERS, bakeColliders
+
+
+class ChunkStreamer:
+    """
+    Divides a level into square chunks, and keeps only the chunks near the
+    camera and the players loaded, so that building a scene and the memory
+    it takes are bounded by how far around them is loaded, rather than by
+    the size of the level.
+
+    A chunk is loaded by building the entities whose top left corner lies
+    within it, and adding them (and the baked colliders covering the chunk)
+    to the scene and to the collision engine. A chunk is unloaded by
+    removing them again, remembering the state of any entity that changes
+    while playing (e.g. a switch which has been turned off) so that it is
+    restored when the chunk is loaded again.
+
+    A level that was not compiled has no baked colliders, hence they are
+    baked when it is streamed, which builds all of its walls and static
+    platforms once. Large levels should be compiled to avoid it.
+
+    Only the kinds of entities in STREAMED_KINDS are streamed. The players,
+    bosses and moving platforms move across the level, and the doors are
+    needed to complete it, hence these are always loaded.
+    """
+
+    STREAMED_KINDS = [
+        "walls",
+        "sPlatforms",
+        "dPlatforms",
+        "switches",
+        "spikes",
+        "spears",
+        "decorations",
+    ]
+
+    # The width and height of a chunk in pixels
+    CHUNK_SIZE = 640
+
+    # The number of chunks loaded around the camera and the players. An
+    # entity is only found through the chunk of its top left corner, hence
+    # entities larger than this many chunks may appear late.
+    RADIUS = 1
+
+    # Levels spanning more chunks than this (in either direction) are large
+    # enough to be streamed
+    MAX_CHUNKS = 8
+
+    def __init__(self, scene, level):
+        """
+        :param scene: Scene Class, the scene to load the chunks into.
+        :param level: Level instance, representing the level.
+        """
+        self.scene = scene
+        self.level = level
+        self.collisionEngine = None
+
+        # The (kind, index, depth) of the records within each chunk, where
+        # the depth keeps the entities drawn in the order of the level no
+        # matter the order their chunks are loaded in
+        self.keyToRecords = {}
+        depth = 0
+        for kind in self.STREAMED_KINDS:
+            for i, data in enumerate(getattr(level, kind)):
+                key = self._computeKey(data.x, data.y)
+                self.keyToRecords.setdefault(key, []).append((kind, i, depth))
+                depth += 1
+
+        # The indices of the solid colliders covering each chunk
+        self.colliders = level.colliders or bakeColliders(level)
+        self.keyToColliders = {}
+        for i, data in enumerate(self.colliders):
+            if LAYERS[data.layer] != "solid":
+                continue
+            rect = pg.Rect(data.x, data.y, data.w, data.h)
+            for key in self._computeKeys(rect, 0):
+                self.keyToColliders.setdefault(key, []).append(i)
+
+        # The entities built for each loaded chunk, and the colliders loaded
+        # along with the number of loaded chunks they cover
+        self.keyToEntities = {}
+        self.colliderToCount = {}
+        self.colliderToHandle = {}
+
+        # The state of the entities of unloaded chunks which have changed
+        self.recordToState = {}
+
+    @classmethod
+    def isLarge(cls, level):
+        """
+        Checks whether a level is large enough to be streamed.
+
+        :param level: Level instance, representing the level.
+        :return: Boolean, whether the level should be streamed.
+        """
+        size = cls.CHUNK_SIZE * cls.MAX_CHUNKS
+        for kind in cls.STREAMED_KINDS:
+            for data in getattr(level, kind):
+                if data.x > size or data.y > size:
+                    return True
+        return False
+
+    def attach(self, collisionEngine):
+        """
+        Sets the collision engine that the colliders and the entities of the
+        chunks are added to as they are loaded, once it has taken in the
+        entities already in the scene.
+
+        :param collisionEngine: CollisionEngine instance, of the scene.
+        """
+        self.collisionEngine = collisionEngine
+        for i in self.colliderToCount:
+            self._addCollider(i)
+
+    def update(self, areas):
+        """
+        Loads the chunks near any of the given areas, and unloads the chunks
+        which have become far enough from all of them.
+
+        Chunks are only unloaded once they are one chunk further away than
+        the chunks loaded, so that moving back and forth along the edge of a
+        chunk does not keep loading and unloading it.
+
+        :param areas: List, containing pygame.Rect objects of the areas to
+        load around (e.g. the view of the camera).
+        """
+        near = set()
+        kept = set()
+        for area in areas:
+            near.update(self._computeKeys(area, self.RADIUS))
+            kept.update(self._computeKeys(area, self.RADIUS + 1))
+
+        for key in near.difference(self.keyToEntities):
+            self.loadChunk(key)
+        for key in set(self.keyToEntities).difference(kept):
+            self.unloadChunk(key)
+
+    def reset(self):
+        """
+        Unloads every chunk and forgets the state of their entities, so that
+        the chunks are loaded as they were at the start of the level.
+        """
+        for key in list(self.keyToEntities):
+            self.unloadChunk(key)
+        self.recordToState.clear()
+
+    def loadChunk(self, key):
+        """
+        Builds the entities and adds the colliders of a chunk.
+
+        :param key: 2-Tuple, the (column, row) of the chunk.
+        """
+        entities = []
+        for kind, i, depth in self.keyToRecords.get(key, []):
+            group, entity = self.scene.buildEntity(kind,
+                                                   getattr(self.level, kind)[i])
+            if (kind, i) in self.recordToState:
+                entity.reset(self.recordToState.pop((kind, i)))
+
+            self.scene.addEntity(entity, group, depth)
+            if self.collisionEngine:
+                self.collisionEngine.addStatic(entity, group)
+            entities.append((kind, i, group, entity))
+        self.keyToEntities[key] = entities
+
+        for i in self.keyToColliders.get(key, []):
+            count = self.colliderToCount.get(i, 0)
+            if count == 0 and self.collisionEngine:
+                self._addCollider(i)
+            self.colliderToCount[i] = count + 1
+
+    def unloadChunk(self, key):
+        """
+        Removes the entities and colliders of a chunk, remembering the state
+        of its entities.
+
+        :param key: 2-Tuple, the (column, row) of the chunk.
+        """
+        for kind, i, group, entity in self.keyToEntities.pop(key):
+            if hasattr(entity, "snapshot"):
+                self.recordToState[(kind, i)] = entity.snapshot()
+
+            self.scene.removeEntity(entity, group)
+            if self.collisionEngine:
+                self.collisionEngine.removeStatic(entity)
+
+        for i in self.keyToColliders.get(key, []):
+            self.colliderToCount[i] -= 1
+            if self.colliderToCount[i] == 0:
+                del self.colliderToCount[i]
+                handle = self.colliderToHandle.pop(i, None)
+                if handle:
+                    self.collisionEngine.removeStatic(handle)
+
+    def _addCollider(self, i):
+        """
+        Adds a baked collider to the collision engine.
+
+        :param i: Integer, the index of the collider in the level.
+        """
+        data = self.colliders[i]
+        rect = pg.Rect(data.x, data.y, data.w, data.h)
+        self.colliderToHandle[i] = self.collisionEngine.addSolid(rect)
+
+    def _computeKey(self, x, y):
+        """
+        :param x: Number, the x-position in pixels.
+        :param y: Number, the y-position in pixels.
+        :return: 2-Tuple, the (column, row) of the chunk containing it.
+        """
+        return int(x // self.CHUNK_SIZE), int(y // self.CHUNK_SIZE)
+
+    def _computeKeys(self, rect, radius):
+        """
+        :param rect: pygame.Rect, the area to cover.
+        :param radius: Integer, the number of chunks to extend the area by.
+        :return: List, containing the keys of the chunks covering the area.
+        """
+        left, top = self._computeKey(rect.left, rect.top)
+        right, bottom = self._computeKey(max(rect.left, rect.right - 1),
+                                         max(rect.top, rect.bottom - 1))
+        return [(column, row)
+                for column in range(left - radius, right + radius + 1)
+                for row in range(top - radius, bottom + radius + 1)]
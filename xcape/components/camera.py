@@ -53,9 +53,9 @@ class SimpleCamera(GameObject):
         elif abs(dx) > 500:
             self.physics.maxSpeed = 30
 
+        # The physics is stepped by the physics world of the scene
         self.physics.fixVelocityX(dx)
         self.physics.fixVelocityY(dy)
-        self.physics.update()
 
     def computeShift(self, gameobject):
         """
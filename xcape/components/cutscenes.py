@@ -16,6 +16,10 @@ class BaseCutscene(GameObject):
     The base cutscene for any cutscene.
     """
 
+    # The keys handled by the cutscene, which the cutscene engine subscribes
+    # to while the cutscene plays
+    KEYS = []
+
     def __init__(self, screen):
         """
         :param screen: pygame.Surface, representing the screen.
@@ -39,6 +43,8 @@ class OfficeCutscene(BaseCutscene):
     The cutscene where the dog and cat are talking in the office.
     """
 
+    KEYS = [pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.rect = pg.Rect(0, 0, 0, 0)
@@ -121,6 +127,8 @@ class TelephoneCutscene(BaseCutscene):
     The cutscene where the dog is talking on the phone.
     """
 
+    KEYS = [pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.rect = pg.Rect(0, 0, 0, 0)
@@ -209,6 +217,8 @@ class JailCutscene(BaseCutscene):
     The cutscene where the cat is being escorted to jail.
     """
 
+    KEYS = [pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.rect = pg.Rect(0, 0, 0, 0)
@@ -290,6 +300,8 @@ class PigCutscene(BaseCutscene):
     The cutscene where the pig boss appears.
     """
 
+    KEYS = [pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.rect = pg.Rect(0, 0, 0, 0)
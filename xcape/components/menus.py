@@ -18,6 +18,10 @@ class BaseMenu(GameObject):
     The base menu that should be inherited by all menus.
     """
 
+    # The keys handled by the menu, which the menu engine subscribes to while
+    # the menu is shown
+    KEYS = []
+
     def __init__(self, screen):
         """
         :param screen: pygame.Surface, representing the screen.
@@ -40,6 +44,8 @@ class SplashMenu(BaseMenu):
     The splash screen of the game.
     """
 
+    KEYS = [pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.effect = FadeEffect(screen)
@@ -94,6 +100,8 @@ class IntroMenu(BaseMenu):
     The intro screen of the game after the splash screen.
     """
 
+    KEYS = [pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.effect = FadeEffect(screen)
@@ -152,6 +160,8 @@ class MainMenu(BaseMenu):
     The main menu of the game.
     """
 
+    KEYS = [pg.K_UP, pg.K_DOWN, pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.totalOptions = 4
@@ -255,6 +265,9 @@ class OptionsMenu(BaseMenu):
     The options menu of the game.
     """
 
+    KEYS = [pg.K_ESCAPE, pg.K_UP, pg.K_DOWN, pg.K_LEFT, pg.K_RIGHT,
+            pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         fontSize = 22
@@ -410,6 +423,8 @@ class LoseMenu(BaseMenu):
     The game over menu of the game.
     """
 
+    KEYS = [pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.fontSize = 18
@@ -457,6 +472,8 @@ class WinMenu(BaseMenu):
     The win menu of the game.
     """
 
+    KEYS = [pg.K_RETURN]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.screen = screen
@@ -510,6 +527,8 @@ class PauseMenu(BaseMenu):
     The pause menu of the game.
     """
 
+    KEYS = [pg.K_ESCAPE]
+
     def __init__(self, screen):
         super().__init__(screen)
         self.fontSize = 50
@@ -0,0 +1,122 @@
+"""
+Responsible for displaying the performance statistics of the game.
+"""
+
+import pygame as pg
+
+import xcape.common.settings as settings
+from xcape.common.object import GameObject
+from xcape.common.profiler import PROFILER
+
+
+class PerformanceOverlay(GameObject):
+    """
+    Draws the statistics collected by the profiler above everything else.
+    """
+
+    ENGINES = [
+        ("scene", "scene_engine"),
+        ("menu", "menu_engine"),
+        ("cutscene", "cutscene_engine"),
+    ]
+
+    def __init__(self, screen, profiler=PROFILER):
+        """
+        :param screen: pygame.Surface, representing the screen.
+        :param profiler: Profiler instance, the source of the statistics.
+        """
+        self.screen = screen
+        self.profiler = profiler
+        self.rect = pg.Rect(5, 5, 230, 0)
+
+        self.font = pg.font.SysFont(settings.FONT, 16)
+        self.lineHeight = self.font.get_linesize()
+        self.graphHeight = 40
+
+    def __str__(self):
+        return "performance_overlay"
+
+    def handleEvent(self, event):
+        if event.type == pg.KEYDOWN:
+            if event.key == pg.K_F3:
+                self.profiler.toggle()
+
+        if event.type == self.MENU_EVENT:
+            if event.category == "screen":
+                self.screen = pg.display.get_surface()
+
+    def update(self):
+        pass
+
+    def draw(self, camera=None):
+        if not self.profiler.isEnabled:
+            return
+
+        lines = self._buildLines()
+        self.rect.height = len(lines)*self.lineHeight + self.graphHeight + 15
+
+        panel = pg.Surface(self.rect.size)
+        panel.fill(settings.COLOURS["black"])
+        panel.set_alpha(180)
+        self.screen.blit(panel, self.rect)
+
+        x, y = self.rect.x + 5, self.rect.y + 5
+        for line in lines:
+            image = self.font.render(line, True, settings.COLOURS["white"])
+            self.screen.blit(image, (x, y))
+            y += self.lineHeight
+
+        self._drawGraph(pg.Rect(x, y + 5, self.rect.width - 10, self.graphHeight))
+
+    def _buildLines(self):
+        """
+        Formats the statistics of the last completed frame into text.
+
+        :return: List, containing strings for each line of the overlay.
+        """
+        profiler = self.profiler
+        timings = profiler.lastTimings
+        counters = profiler.lastCounters
+
+        try:
+            frameTime = profiler.frameTimes[-1]
+        except IndexError:
+            frameTime = 0
+
+        lines = ["FPS: {:.1f} ({} ms)".format(profiler.fps, frameTime)]
+        for label, name in self.ENGINES:
+            lines.append("{}: update {:.2f} ms, draw {:.2f} ms"
+                         .format(label,
+                                 timings.get(name + "_update", 0),
+                                 timings.get(name + "_draw", 0)))
+
+        lines.append("collision checks: {} (masks: {})"
+                     .format(counters.get("collision_checks", 0),
+                             counters.get("mask_checks", 0)))
+
+        blits = sorted(profiler.lastBlits.items())
+        lines.append("blits: {}".format(sum(n for _, n in blits)))
+        lines += ["  {}: {}".format(name, n) for name, n in blits]
+        return lines
+
+    def _drawGraph(self, area):
+        """
+        Draws the rolling frame time graph, along with a line marking the
+        frame time budget.
+
+        :param area: pygame.Rect, the area of the screen to draw within.
+        """
+        budget = 1000/settings.FPS
+        scale = area.height / (2*budget)
+
+        yBudget = area.bottom - budget*scale
+        pg.draw.line(self.screen, settings.COLOURS["green"],
+                     (area.left, yBudget), (area.right, yBudget))
+
+        frameTimes = list(self.profiler.frameTimes)[-area.width:]
+        if len(frameTimes) < 2:
+            return
+
+        points = [(area.left + i, area.bottom - min(t*scale, area.height))
+                  for i, t in enumerate(frameTimes)]
+        pg.draw.lines(self.screen, settings.COLOURS["yellow"], False, points)
@@ -1,9 +1,8 @@
 """
 Responsible for applying physics on a game object.
 """
-from collections import OrderedDict
 
-from pygame.math import Vector2
+import math
 
 from xcape.common.object import GameObject
 
@@ -17,65 +16,292 @@ class PhysicsComponent(GameObject):
     The units for the physics variables are listed below.
 
     Displacement:       Pixels.
-    Velocity:           Pixels per physics tick.
-    Time:               Physics tick.
+    Velocity:           Pixels per physics step.
+    Time:               Physics step.
+
+    The component does not step itself; it is stepped together with all the
+    other bodies in a scene by the physics world.
+
+    The velocity and displacement components are accumulated in a fixed set
+    of named channels, each held in a preallocated slot, so that no memory
+    is allocated while stepping.
+
+    The state of the body (see STATE_SIZE) and its channels are held in
+    lists of its own, or in rows of the arrays of a physics world stepping
+    all its bodies together using NumPy, so that they are never gathered
+    from or scattered back to the bodies.
+
+    The position of the body is kept in floats so that motion below a pixel
+    is not lost, and the rect of the game object is moved to the nearest
+    pixel once at the end of every step. Anything else moving the rect along
+    an axis (e.g. the collision engine) overrides the position along it.
+
+    A body that comes to rest on the ground falls asleep and is no longer
+    integrated, until a non-zero velocity or displacement is added to it or
+    its game object is moved by something else.
+
+    A body can also be made dormant (e.g. while its game object is far from
+    the camera), which skips it until it is made active again, counting the
+    physics steps it has missed so that its game object can catch up.
     """
 
+    CHANNELS = {
+        "gravity": 0,
+        "move": 1,
+        "jump": 2,
+        "collision": 3,
+        "platform": 4,
+    }
+    _NO_FORCES = (0.0,) * len(CHANNELS)
+
+    # The columns of the state of a body, where the rect and previous
+    # positions are NaN until the body has taken its first step
+    (X, Y, VEL_X, VEL_Y, TRAVELLED, GRAVITY, IS_GRAVITY, MAX_SPEED,
+     RECT_X, RECT_Y, PREVIOUS_X, PREVIOUS_Y, WAS_AT_REST, IS_ASLEEP,
+     IS_DORMANT, DORMANT_STEPS) = range(16)
+    STATE_SIZE = 16
+
+    __slots__ = (
+        "gameObject",
+        "velocity",
+        "_state",
+        "_velX",
+        "_velY",
+        "_disX",
+        "_disY",
+    )
+
     def __init__(self, gameObject):
         """
         :param gameObject: GameObject instance, representing any object within
         the game.
         """
         self.gameObject = gameObject
-        self.displacement = Vector2(0, 0)
-        self.velocity = Vector2(0, 0)
-        self.maxSpeed = 20
+        self.velocity = Velocity(self)
 
-        self.gravity = Vector2(0, 2)
+        # Held in lists until the body is bound to the arrays of a physics
+        # world stepping its bodies using NumPy
+        self._state = [0.0] * self.STATE_SIZE
+        self._velX = list(self._NO_FORCES)
+        self._velY = list(self._NO_FORCES)
+        self._disX = list(self._NO_FORCES)
+        self._disY = list(self._NO_FORCES)
+
+        self.maxSpeed = 20
+        self.gravity = 2
         self.isGravity = True
-        self.travelled = 0
+        self.reset()
 
-        self._nameToDisX = OrderedDict()
-        self._nameToDisY = OrderedDict()
-        self._nameToVelX = OrderedDict()
-        self._nameToVelY = OrderedDict()
+    @property
+    def x(self):
+        return self._state[self.X]
 
-        # Increasing the tick rate too much can cause choppiness!
-        # This variable needs to be tweaked until it feels smooth enough.
-        self.PHYSICS_TICK = 2
-        self.tick = 0
+    @x.setter
+    def x(self, value):
+        self._state[self.X] = value
 
-    def update(self):
-        self.tick += 1
-        if self.tick % self.PHYSICS_TICK == 0:
-            self.immediateUpdate()
-            self.tick = 0
+    @property
+    def y(self):
+        return self._state[self.Y]
+
+    @y.setter
+    def y(self, value):
+        self._state[self.Y] = value
+
+    @property
+    def travelled(self):
+        return self._state[self.TRAVELLED]
+
+    @travelled.setter
+    def travelled(self, value):
+        self._state[self.TRAVELLED] = value
+
+    @property
+    def gravity(self):
+        return self._state[self.GRAVITY]
+
+    @gravity.setter
+    def gravity(self, value):
+        self._state[self.GRAVITY] = value
+
+    @property
+    def isGravity(self):
+        return bool(self._state[self.IS_GRAVITY])
+
+    @isGravity.setter
+    def isGravity(self, value):
+        self._state[self.IS_GRAVITY] = float(value)
+
+    @property
+    def maxSpeed(self):
+        return self._state[self.MAX_SPEED]
 
-    def immediateUpdate(self):
+    @maxSpeed.setter
+    def maxSpeed(self, value):
+        self._state[self.MAX_SPEED] = value
+
+    @property
+    def previous(self):
+        x = self._state[self.PREVIOUS_X]
+        if math.isnan(x):
+            return None
+        return int(x), int(self._state[self.PREVIOUS_Y])
+
+    @property
+    def isAsleep(self):
+        return bool(self._state[self.IS_ASLEEP])
+
+    @isAsleep.setter
+    def isAsleep(self, value):
+        self._state[self.IS_ASLEEP] = float(value)
+
+    @property
+    def isDormant(self):
+        return bool(self._state[self.IS_DORMANT])
+
+    @isDormant.setter
+    def isDormant(self, value):
+        self._state[self.IS_DORMANT] = float(value)
+
+    @property
+    def dormantSteps(self):
+        return int(self._state[self.DORMANT_STEPS])
+
+    @dormantSteps.setter
+    def dormantSteps(self, value):
+        self._state[self.DORMANT_STEPS] = value
+
+    def update(self):
         """
-        Updates the physics immediately, ignoring the physics tick rate.
+        Advances the physics by a single physics step.
         """
+        if self.checkDormant() or self.checkAsleep():
+            return
+
+        self.adoptRect()
+        self.beginStep()
+
         self.applyGravity()
         self.limitSpeed()
 
         self.applyNetVelocity()
         self.applyNetDisplacement()
+        self.syncRect()
+
+    def reset(self):
+        """
+        Brings the body to rest and discards everything it has accumulated,
+        so that it takes over the position of its rect on the next step (e.g.
+        when the scene is restarted).
+        """
+        state = self._state
+        state[self.VEL_X] = 0.0
+        state[self.VEL_Y] = 0.0
+        state[self.TRAVELLED] = 0.0
+        state[self.RECT_X] = state[self.RECT_Y] = float("nan")
+        state[self.PREVIOUS_X] = state[self.PREVIOUS_Y] = float("nan")
+        state[self.WAS_AT_REST] = 0.0
+        state[self.IS_ASLEEP] = 0.0
+        state[self.DORMANT_STEPS] = 0.0
+
+        self._velX[:] = self._NO_FORCES
+        self._velY[:] = self._NO_FORCES
+        self._disX[:] = self._NO_FORCES
+        self._disY[:] = self._NO_FORCES
+
+    def bind(self, state, velX, velY, disX, disY):
+        """
+        Moves the state and forces of the body into the given rows (e.g. of
+        the arrays owned by a physics world), which hold them from then on.
+
+        :param state: Array, the row holding the state (see STATE_SIZE).
+        :param velX: Array, the row holding the velocity channels along x.
+        :param velY: Array, the row holding the velocity channels along y.
+        :param disX: Array, the row holding the displacement channels along x.
+        :param disY: Array, the row holding the displacement channels along y.
+        """
+        state[:] = self._state
+        velX[:] = self._velX
+        velY[:] = self._velY
+        disX[:] = self._disX
+        disY[:] = self._disY
+
+        self._state = state
+        self._velX = velX
+        self._velY = velY
+        self._disX = disX
+        self._disY = disY
+
+    def unbind(self):
+        """
+        Moves the state and forces of the body back into lists of its own.
+        """
+        self._state = [float(v) for v in self._state]
+        self._velX = [float(v) for v in self._velX]
+        self._velY = [float(v) for v in self._velY]
+        self._disX = [float(v) for v in self._disX]
+        self._disY = [float(v) for v in self._disY]
+
+    def beginStep(self):
+        """
+        Remembers where the body starts the physics step from, so that the
+        collision engine can sweep its movement and the body can tell whether
+        it stayed at rest throughout the step.
+        """
+        state = self._state
+        state[self.PREVIOUS_X], state[self.PREVIOUS_Y] = \
+            self.gameObject.rect.topleft
+        state[self.WAS_AT_REST] = float(state[self.VEL_X] == 0 and
+                                        state[self.VEL_Y] == 0)
+
+    def adoptRect(self):
+        """
+        Takes over the position of the rect along any axis it was moved along
+        since the last step by something other than the physics.
+        """
+        state = self._state
+        x, y = self.gameObject.rect.topleft
+        if x != state[self.RECT_X]:
+            state[self.X] = state[self.RECT_X] = x
+        if y != state[self.RECT_Y]:
+            state[self.Y] = state[self.RECT_Y] = y
+
+    def syncRect(self):
+        """
+        Moves the rect to the pixel nearest to the position of the body.
+        """
+        state = self._state
+        x = int(math.floor(state[self.X] + 0.5))
+        y = int(math.floor(state[self.Y] + 0.5))
+        state[self.RECT_X] = x
+        state[self.RECT_Y] = y
+        self.gameObject.rect.topleft = (x, y)
+
+    def moveTo(self, x, y):
+        """
+        Moves the body to the given position, then moves the rect with it.
+
+        :param x: Number, the x-position in pixels.
+        :param y: Number, the y-position in pixels.
+        """
+        self._state[self.X] = x
+        self._state[self.Y] = y
+        self.syncRect()
 
     def applyNetDisplacement(self):
         """
         Applies the resultant displacement vector.
         """
-        self.displacement.x += sum(self._nameToDisX.values())
-        self.displacement.y += sum(self._nameToDisY.values())
-        self.gameObject.rect.x += self.displacement.x
-        self.gameObject.rect.y += self.displacement.y
-        self.travelled += self.displacement.length()
+        state = self._state
+        dx = sum(self._disX)
+        dy = sum(self._disY)
+        state[self.X] += dx
+        state[self.Y] += dy
+        state[self.TRAVELLED] += math.sqrt(dx*dx + dy*dy)
 
         # Displacement applied is NOT conserved
-        self._nameToDisX.clear()
-        self._nameToDisY.clear()
-        self.displacement.x = 0
-        self.displacement.y = 0
+        self._disX[:] = self._NO_FORCES
+        self._disY[:] = self._NO_FORCES
 
     def addDisplacementX(self, name, amount):
         """
@@ -84,7 +310,9 @@ class PhysicsComponent(GameObject):
         :param name: String, the name of the displacement being applied.
         :param amount: Number, the amount of displacement to add.
         """
-        self._nameToDisX[name] = amount
+        self._disX[self._channel(name)] = amount
+        if amount:
+            self._state[self.IS_ASLEEP] = 0.0
 
     def addDisplacementY(self, name, amount):
         """
@@ -93,20 +321,23 @@ class PhysicsComponent(GameObject):
         :param name: String, the name of the displacement being applied.
         :param amount: Number, the amount of displacement to add.
         """
-        self._nameToDisY[name] = amount
+        self._disY[self._channel(name)] = amount
+        if amount:
+            self._state[self.IS_ASLEEP] = 0.0
 
     def applyNetVelocity(self):
         """
         Applies the resultant velocity vector.
         """
-        self.velocity.x += sum(self._nameToVelX.values())
-        self.velocity.y += sum(self._nameToVelY.values())
-        self.gameObject.rect.x += self.velocity.x
-        self.gameObject.rect.y += self.velocity.y
-        self.travelled += self.velocity.length()
+        state = self._state
+        vx = state[self.VEL_X] = state[self.VEL_X] + sum(self._velX)
+        vy = state[self.VEL_Y] = state[self.VEL_Y] + sum(self._velY)
+        state[self.X] += vx
+        state[self.Y] += vy
+        state[self.TRAVELLED] += math.sqrt(vx*vx + vy*vy)
 
-        self._nameToVelX.clear()
-        self._nameToVelY.clear()
+        self._velX[:] = self._NO_FORCES
+        self._velY[:] = self._NO_FORCES
 
     def addVelocityX(self, name, amount):
         """
@@ -115,7 +346,9 @@ class PhysicsComponent(GameObject):
         :param name: String, the name of the velocity being applied.
         :param amount: Number, the amount of velocity to add.
         """
-        self._nameToVelX[name] = amount
+        self._velX[self._channel(name)] = amount
+        if amount:
+            self._state[self.IS_ASLEEP] = 0.0
 
     def addVelocityY(self, name, amount):
         """
@@ -124,7 +357,9 @@ class PhysicsComponent(GameObject):
         :param name: String, the name of the velocity being applied.
         :param amount: Number, the amount of velocity to add.
         """
-        self._nameToVelY[name] = amount
+        self._velY[self._channel(name)] = amount
+        if amount:
+            self._state[self.IS_ASLEEP] = 0.0
 
     def fixVelocityX(self, amount):
         """
@@ -132,8 +367,10 @@ class PhysicsComponent(GameObject):
 
         :param amount: Number, the amount of velocity to add.
         """
-        self._nameToVelX.clear()
-        self.velocity.x = amount
+        self._velX[:] = self._NO_FORCES
+        self._state[self.VEL_X] = amount
+        if amount:
+            self._state[self.IS_ASLEEP] = 0.0
 
     def fixVelocityY(self, amount):
         """
@@ -141,31 +378,127 @@ class PhysicsComponent(GameObject):
 
         :param amount: Number, the amount of velocity to add.
         """
-        self._nameToVelX.clear()
-        self.velocity.y = amount
+        self._velY[:] = self._NO_FORCES
+        self._state[self.VEL_Y] = amount
+        if amount:
+            self._state[self.IS_ASLEEP] = 0.0
+
+    def checkDormant(self):
+        """
+        Checks whether the body is dormant, counting the physics step it is
+        skipped for if so.
+
+        :return: Boolean, whether the body is dormant.
+        """
+        if self._state[self.IS_DORMANT]:
+            self._state[self.DORMANT_STEPS] += 1
+            return True
+        return False
+
+    def checkAsleep(self):
+        """
+        Checks whether the body is asleep, waking it up if its game object
+        has been moved since it fell asleep (e.g. when respawning).
+
+        :return: Boolean, whether the body is still asleep.
+        """
+        state = self._state
+        if state[self.IS_ASLEEP]:
+            x, y = self.gameObject.rect.topleft
+            if x == state[self.PREVIOUS_X] and y == state[self.PREVIOUS_Y]:
+                return True
+            state[self.IS_ASLEEP] = 0.0
+        return False
+
+    def settle(self):
+        """
+        Puts the body to sleep if it stayed at rest on the ground throughout
+        the last physics step, i.e. its gravity was entirely cancelled by
+        whatever it stands on.
+        """
+        state = self._state
+        previous = (state[self.PREVIOUS_X], state[self.PREVIOUS_Y])
+        state[self.IS_ASLEEP] = float(
+            getattr(self.gameObject, "isOnGround", False) and
+            state[self.WAS_AT_REST] and
+            state[self.VEL_X] == 0 and
+            state[self.VEL_Y] == 0 and
+            self.gameObject.rect.topleft == previous and
+            not any(self._velX) and
+            not any(self._velY) and
+            not any(self._disX) and
+            not any(self._disY))
 
     def applyGravity(self):
         """
         Applies gravity on the game object.
         """
-        if self.isGravity:
-            self.addVelocityY("gravity", self.gravity.y)
+        # Gravity alone must not wake up a body resting on the ground
+        if self._state[self.IS_GRAVITY]:
+            self._velY[self.CHANNELS["gravity"]] = self._state[self.GRAVITY]
 
     def limitSpeed(self):
         """
         Sets a maximum velocity on the game object.
 
-        This is important otherwise very fast velocities can cause game
-        objects to pass through blocks, bypassing the collision checker.
+        This is purely a gameplay limit; fast game objects do not pass through
+        blocks since the collision engine sweeps their movement.
         """
-        if abs(self.velocity.x) > self.maxSpeed:
-            if self.velocity.x > 0:
-                self.velocity.x = self.maxSpeed
+        state = self._state
+        maxSpeed = state[self.MAX_SPEED]
+        if abs(state[self.VEL_X]) > maxSpeed:
+            if state[self.VEL_X] > 0:
+                state[self.VEL_X] = maxSpeed
             else:
-                self.velocity.x = -self.maxSpeed
+                state[self.VEL_X] = -maxSpeed
 
-        if abs(self.velocity.y) > self.maxSpeed:
-            if self.velocity.y > 0:
-                self.velocity.y = self.maxSpeed
+        if abs(state[self.VEL_Y]) > maxSpeed:
+            if state[self.VEL_Y] > 0:
+                state[self.VEL_Y] = maxSpeed
             else:
-                self.velocity.y = -self.maxSpeed
+                state[self.VEL_Y] = -maxSpeed
+
+    def _channel(self, name):
+        """
+        Finds the slot of the given channel.
+
+        :param name: String, the name of the channel.
+        :return: Integer, the index of the channel's slot.
+        """
+        try:
+            return self.CHANNELS[name]
+        except KeyError:
+            raise KeyError("'{}' is an invalid channel! The channels allowed "
+                           "are {}!".format(name, list(self.CHANNELS)))
+
+
+class Velocity:
+    """
+    Represents the velocity of a physics component, read from and written to
+    wherever the component holds its state.
+    """
+
+    __slots__ = ("physics",)
+
+    def __init__(self, physics):
+        """
+        :param physics: PhysicsComponent instance, the body moving.
+        """
+        self.physics = physics
+
+    @property
+    def x(self):
+        return self.physics._state[PhysicsComponent.VEL_X]
+
+    @x.setter
+    def x(self, value):
+        self.physics._state[PhysicsComponent.VEL_X] = value
+
+    @property
+    def y(self):
+        return self.physics._state[PhysicsComponent.VEL_Y]
+
+    @y.setter
+    def y(self, value):
+        self.physics._state[PhysicsComponent.VEL_Y] = value
+
@@ -2,11 +2,14 @@
 Responsible for rendering of a game object.
 """
 
+import bisect
+
 import pygame as pg
 
 from xcape.common import settings as settings
 from xcape.common.loader import CUTSCENE_RESOURCES
 from xcape.common.object import GameObject
+from xcape.common.profiler import PROFILER
 
 
 class RenderComponent(GameObject):
@@ -14,14 +17,17 @@ class RenderComponent(GameObject):
     Attaches to a game object to allow rendering.
     """
 
-    def __init__(self, gameObject, enableOrientation=False, enableRepeat=True):
+    def __init__(self, gameObject, enableOrientation=False, enableRepeat=True,
+                 enableMasks=False):
         """
         :param gameObject: GameObject instance, the instance to attach to.
         :param enableOrientation: Boolean, whether to consider direction.
         :param enableRepeat: Boolean, whether to keep repeating the animation.
+        :param enableMasks: Boolean, whether to build the masks of the frames.
         """
         self.enableOrientation = enableOrientation
         self.enableRepeat = enableRepeat
+        self.enableMasks = enableMasks
 
         self.stateToAnimation = {}
         self.stateToTiming = {}
@@ -29,6 +35,11 @@ class RenderComponent(GameObject):
         self.timings = []
         self.image = None
 
+        # The masks of each animation frame and orientation, built along with
+        # the frames, and the key of the mask of the image rendered last
+        self.frameToMask = {}
+        self._drawn = None
+
         # Units are in milliseconds
         self.origin = pg.time.get_ticks()
         self.elapsed = 0.0
@@ -46,6 +57,9 @@ class RenderComponent(GameObject):
             self._updateAnimation()
 
     def draw(self, camera=None):
+        if PROFILER.isEnabled:
+            PROFILER.countBlit(self.gameObject)
+
         if camera:
             self.gameObject.screen.blit(self.image, camera.apply(self.gameObject))
         else:
@@ -76,6 +90,70 @@ class RenderComponent(GameObject):
             self.stateToTiming[state] = timings
             self.stateToAnimation[state] = [images]
 
+        self._buildMasks(self.stateToAnimation[state])
+
+    def place(self, x, y):
+        """
+        Gives the game object a rect at the given position, sized to fit the
+        image of the current state (e.g. so that the rect of a static entity
+        has its size before the entity is first updated).
+
+        :param x: Integer, the x-position of the rect.
+        :param y: Integer, the y-position of the rect.
+        """
+        self.gameObject.rect = pg.Rect(x, y, 0, 0)
+        self.update()
+
+    def catchUp(self, ticks):
+        """
+        Brings the animation to where updating it at each of the given times
+        would have left it, without rendering any of the frames (e.g. after
+        its game object missed those updates while out of sight).
+
+        :param ticks: List, containing the times (in milliseconds) of the
+        missed updates, in order.
+        """
+        if not ticks:
+            return
+
+        self._changeAnimation(self.state)
+        lastIndex = len(self.animation)-1
+        duration = self.timings[-1]
+
+        i = 0
+        while i < len(ticks):
+            elapsed = ticks[i] - self.origin
+
+            if duration >= elapsed >= 0:
+                if elapsed > self.timings[self.frameNum]:
+                    self.frameNum = min(self.frameNum+1, lastIndex)
+                    i += 1
+                else:
+                    # Skips the updates until the frame is next due
+                    end = self.origin + self.timings[self.frameNum]
+                    i = bisect.bisect_right(ticks, end, i)
+
+            elif elapsed > duration and not self.enableRepeat:
+                self.frameNum = lastIndex
+                break
+
+            else:
+                self.frameNum = 0
+                self.origin = ticks[i]
+                i += 1
+
+        self.elapsed = ticks[-1] - self.origin
+
+    def isStill(self):
+        """
+        Checks whether the rendered image can never change, i.e. every
+        animation is a single frame (and there is no orientation to flip).
+
+        :return: Boolean, whether the rendered image can never change.
+        """
+        return (not self.enableOrientation and
+                all(len(a) == 1 for a in self.stateToAnimation.values()))
+
     def flip(self, isVertical, isHorizontal):
         """
         Reflects vertically the images of the current animation.
@@ -97,9 +175,11 @@ class RenderComponent(GameObject):
 
         :param DIMENSIONS: 2-Tuple, containing integers for new (x, y) size.
         """
+        self.frameToMask = {}
         for state, frames in self.stateToAnimation.items():
             frames = [pg.transform.scale(f, DIMENSIONS) for f in frames]
             self.stateToAnimation[state] = frames
+            self._buildMasks(frames)
 
     def _updateAnimation(self):
         """
@@ -125,10 +205,14 @@ class RenderComponent(GameObject):
         else:
             self._resetAnimation()
 
-        self.image = self.animation[self.frameNum]
+        frame = self.animation[self.frameNum]
+        self.image = frame
         self._updateOrientation()
         self.gameObject.rect.size = self.image.get_size()
 
+        # The image is a new surface only if it was flipped
+        self._drawn = (frame, self.image is not frame)
+
     def _updateOrientation(self):
         """
         Ensures that the rendered image is facing either left or right correctly.
@@ -168,6 +252,23 @@ class RenderComponent(GameObject):
         """
         flipped = [effect(frame, *args) for frame in self.animation]
         self.stateToAnimation[self.state] = flipped
+        self._buildMasks(flipped)
+
+    def _buildMasks(self, frames):
+        """
+        Builds the masks of the given frames facing either way, if the masks
+        are enabled.
+
+        :param frames: List, containing pygame.Surface objects.
+        """
+        if not self.enableMasks:
+            return
+
+        for frame in frames:
+            self.frameToMask[frame, False] = pg.mask.from_surface(frame)
+            if self.enableOrientation:
+                flipped = pg.transform.flip(frame, True, False)
+                self.frameToMask[frame, True] = pg.mask.from_surface(flipped)
 
     @property
     def state(self):
@@ -197,6 +298,18 @@ class RenderComponent(GameObject):
             raise ValueError("The only orientations allowed are {} "
                              .format(faces))
 
+    @property
+    def mask(self):
+        """
+        :return: pygame.mask.Mask, the mask of the image rendered last.
+        """
+        try:
+            return self.frameToMask[self._drawn]
+        except KeyError:
+            raise ValueError("The render component for '{}' has no mask of "
+                             "its image! Masks must be enabled, and an image "
+                             "rendered.".format(self.gameObject))
+
     @property
     def gameObject(self):
         return self._gameObject
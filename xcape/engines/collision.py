@@ -1,196 +1,560 @@
 """
 The collision engine of the game.
 """
+import math
+
 import pygame as pg
-from pygame.math import Vector2
 
 from xcape.common.loader import SFX_RESOURCES
 from xcape.common.object import GameObject
+from xcape.common.profiler import PROFILER
+from xcape.common.spatial import SpatialHash, mergeRects, sweepAndPrune
 from xcape.components.audio import AudioComponent
 
+# Used to measure angles (which is mathematically equivalent to bearings)
+FULL_ROTATION = 360
+
 
 class CollisionEngine(GameObject):
     """
-    A specialised (non-scalable) collision engine that handles collisions
-    between all entities in a scene.
+    A specialised collision engine that handles collisions between all
+    entities in a scene.
+
+    Every kind of entity is put on a collision layer, and how an entity
+    responds to touching another depends only on the layers of the two (see
+    LAYER_RESPONSES). Every physics step, all the contacts of each moving
+    entity are gathered at once, then dispatched to the responses layer by
+    layer.
+
+    The entities that never move are bucketed into a spatial hash, so that
+    gathering the contacts of a moving entity is a single query near it. The
+    entities that move are tested against each other using sweep and prune.
+
+    The walls and static platforms are not collided with directly, but
+    through the fewest boxes covering them (see mergeSolids).
+
+    The triggers and hazards only react when a player starts (or keeps)
+    overlapping them rather than blocking the player. Which players overlap
+    which of them is remembered between physics steps, so that e.g. touching
+    a spike kills a player only once. The players stopping to overlap them
+    are dispatched to exit handlers by layer (see LAYER_EXITS).
     """
 
+    # The collision layer of each kind of entity, where the solids are the
+    # merged walls and static platforms
+    GROUP_LAYERS = {
+        "solids": "solid",
+        "dPlatforms": "one_way",
+        "mPlatforms": "carrier",
+        "switches": "trigger",
+        "doors": "trigger",
+        "spikes": "hazard",
+        "bosses": "hazard",
+        "players": "player",
+    }
+
+    # The kinds of entities that never move, in the order their contacts
+    # are resolved within a layer
+    STATIC_GROUPS = [
+        "solids",
+        "dPlatforms",
+        "switches",
+        "doors",
+        "spikes",
+    ]
+
+    # The kinds of entities that move
+    DYNAMIC_GROUPS = [
+        "players",
+        "mPlatforms",
+        "bosses",
+    ]
+
+    # The methods responding to an entity on the first layer touching
+    # entities on the second layer. The boundary layer has no entities,
+    # standing in for everything outside of the level.
+    LAYER_RESPONSES = {
+        ("player", "solid"): "_respondToSolid",
+        ("player", "one_way"): "_respondToOneWay",
+        ("player", "carrier"): "_respondToCarrier",
+        ("player", "trigger"): "_respondToTrigger",
+        ("player", "hazard"): "_respondToHazard",
+        ("player", "boundary"): "_respondToBoundary",
+    }
+
+    # The methods handling an entity on the first layer no longer
+    # overlapping an entity on the second layer
+    LAYER_EXITS = {
+        ("player", "trigger"): "_exitTrigger",
+        ("player", "hazard"): "_exitHazard",
+    }
+
+    # The order in which the contacts with each layer are responded to
+    LAYER_ORDER = [
+        "solid",
+        "one_way",
+        "carrier",
+        "trigger",
+        "hazard",
+        "boundary",
+    ]
+
+    # The layers that are not responded to while an entity is asleep, since
+    # a sleeping entity has not moved into anything on them
+    AWAKE_LAYERS = [
+        "solid",
+        "one_way",
+    ]
+
+    # The layers whose entities are only touched where their image is opaque
+    # (instead of anywhere within their rect)
+    PRECISE_LAYERS = [
+        "hazard",
+    ]
+
+    # How far around a moving entity its contacts are gathered (in pixels),
+    # so that the entities it touches after being pushed by the responses to
+    # earlier layers are still found
+    CONTACT_MARGIN = 32
+
     def __init__(self, scene):
         """
         :param scene: Scene Class, representing a level.
         """
         self.scene = scene
+        self.sizeToCornerAngles = {}
+        self.sizeToMask = {}
+
+        self.entityToGroup = {}
+        for name in self.STATIC_GROUPS:
+            if name == "solids":
+                entities = self.mergeSolids()
+            else:
+                entities = getattr(scene, name)
+            for entity in entities:
+                self.entityToGroup[entity] = name
+        self.grid = SpatialHash(list(self.entityToGroup))
+
+        self.dynamics = []
+        for name in self.DYNAMIC_GROUPS:
+            for entity in getattr(scene, name):
+                self.entityToGroup[entity] = name
+                self.dynamics.append(entity)
+
+        # The responses of each layer, in the order they are resolved
+        self.layerToResponses = {}
+        for (layer, other), method in self.LAYER_RESPONSES.items():
+            responses = self.layerToResponses.setdefault(layer, [])
+            responses.append((other, getattr(self, method)))
+        for responses in self.layerToResponses.values():
+            responses.sort(key=lambda r: self.LAYER_ORDER.index(r[0]))
+        self.layersToExit = {layers: getattr(self, method)
+                             for layers, method in self.LAYER_EXITS.items()}
+
+        w, h = self.scene.rect.size
+        self.boundary = pg.Rect(-1000, -1000, w+2000, h+2000)
+
+        # The (player, group, trigger) overlaps as of the last physics step
+        self.overlaps = []
+        self.overlapSet = set()
+        self.lastOverlapSet = set()
+        self.playersOutside = set()
+
+        # How many doors and hazards each player overlaps, counted as the
+        # players enter and exit them
+        self.playerToDoors = {}
+        self.playerToHazards = {}
+
         self.audio = AudioComponent(self, isAutoPlay=False)
         self.audio.add("explosion", SFX_RESOURCES["cat_coop_jump"])
 
+        # The scene finds its entities by position through the spatial hash
+        scene.collisionEngine = self
+
+        # The entities of a streamed level come and go as it is streamed
+        if scene.streamer:
+            scene.streamer.attach(self)
+
     def __str__(self):
         return "collision_engine"
 
+    def subscribe(self, router):
+        """
+        Subscribes the collision engine to the keys opening the doors and,
+        with several players, to the keys of the co-op jumps.
+
+        :param router: EventRouter instance, delivering the events of a scene.
+        """
+        keys = [pg.K_RETURN]
+        players = self.scene.players
+        if len(players) > 1:
+            coopJumps = [p.keybinds.get("coop_jump") for p in players]
+            keys += [key for key in coopJumps if key is not None]
+        router.subscribe(self.eventHandler, pg.KEYDOWN, keys)
+
     def eventHandler(self, event):
         if event.type == pg.KEYDOWN:
             if event.key == pg.K_RETURN:
                 self.resolveDoorCollisions()
 
-            try:
-                p1, p2 = self.scene.players
-                p1Jump = p1.keybinds["coop_jump"]
-                p2Jump = p2.keybinds["coop_jump"]
-                if event.key == p1Jump or event.key == p2Jump:
-                    self.resolvePlayerCollisions(30)
-                    self.audio.state = "explosion"
-            except ValueError:
-                pass
+            players = self.scene.players
+            coopJumps = [p.keybinds.get("coop_jump") for p in players]
+            if len(players) > 1 and event.key in coopJumps:
+                self.resolvePlayerCollisions(30)
+                self.audio.state = "explosion"
 
     def update(self):
-        self.resolveWallCollisions()
-        self.resolveSwitchCollisions()
-
-        self.resolveSPlatformCollisions()
-        self.resolveDPlatformCollisions()
-        self.resolveMPlatformCollisions()
-
-        self.resolveSpikeCollisions()
-        self.resolveBossCollisions()
-        self.resolveBoundaryCollision()
+        lastOverlaps = self.overlaps
+        self.lastOverlapSet = self.overlapSet
+        self.overlaps = []
+
+        dynamicContacts = self.findDynamicContacts()
+        for entity in self.dynamics:
+            layer = self.GROUP_LAYERS[self.entityToGroup[entity]]
+            if layer in self.layerToResponses:
+                contacts = self.findContacts(entity, dynamicContacts)
+                self.resolveContacts(entity, layer, contacts)
+
+        self.overlapSet = set(self.overlaps)
+        for overlap in lastOverlaps:
+            if overlap not in self.overlapSet:
+                self.resolveExit(*overlap)
 
         self.audio.update()
 
-    def resolvePlayerCollisions(self, explosionSpeed):
+    def reset(self):
         """
-        Resolves any collisions between players.
+        Forgets the overlaps of the players, e.g. when the scene is reset.
+        """
+        self.overlaps = []
+        self.overlapSet = set()
+        self.lastOverlapSet = set()
+        self.playersOutside = set()
+        self.playerToDoors = {}
+        self.playerToHazards = {}
+
+    def addStatic(self, entity, group):
+        """
+        Adds an entity that never moves (e.g. when a chunk of a streamed level
+        is loaded), unless its kind does not collide (e.g. walls, which
+        collide as solids instead).
 
-        :param explosionSpeed: Integer, the speed at which both players fly
-        away from each other in the x-axis and y-axis respectively.
+        :param entity: GameObject instance, representing the entity.
+        :param group: String, the name of the list of the scene it is in.
         """
-        try:
-            p1, p2 = self.scene.players
-            if pg.sprite.collide_rect(p1, p2):
-                p1.physics.addVelocityY("collision", -explosionSpeed)
-                p2.physics.addVelocityY("collision", -explosionSpeed)
+        if group in self.STATIC_GROUPS:
+            self.entityToGroup[entity] = group
+            self.grid.add(entity)
 
-                if p2.rect.x > p1.rect.x:
-                    p1.physics.addVelocityX("collision", -explosionSpeed)
-                    p2.physics.addVelocityX("collision", explosionSpeed)
+    def addSolid(self, rect):
+        """
+        Adds a box that blocks the players, standing in for the walls and
+        static platforms that it covers.
 
-                else:
-                    p1.physics.addVelocityX("collision", explosionSpeed)
-                    p2.physics.addVelocityX("collision", -explosionSpeed)
+        :param rect: pygame.Rect, the area covered.
+        :return: Collider instance, which can be removed with removeStatic.
+        """
+        collider = Collider(rect)
+        self.addStatic(collider, "solids")
+        return collider
 
-        except ValueError:
-            pass
+    def removeStatic(self, entity):
+        """
+        Removes an entity or collider previously added, which no longer
+        takes part in collisions.
 
-    def resolveWallCollisions(self):
+        :param entity: GameObject instance, representing the entity.
         """
-        Resolves any wall collisions.
+        if self.entityToGroup.pop(entity, None):
+            self.grid.remove(entity)
+
+    def mergeSolids(self):
         """
-        for player in self.scene.players:
-            self._resolveBasicCollision(player, self.scene.walls)
+        Merges the walls and static platforms (which are built from many
+        small pieces) into the fewest boxes covering the same area, which
+        means fewer collision tests and no seams between the pieces for the
+        players to snag on.
 
-    def resolveSPlatformCollisions(self):
+        Levels that were compiled already have them merged.
+
+        :return: List, containing Collider instances.
+        """
+        if self.scene.solids is not None:
+            return [Collider(rect) for rect in self.scene.solids]
+
+        rects = [e.rect for e in self.scene.walls + self.scene.sPlatforms]
+        return [Collider(rect) for rect in mergeRects(rects)]
+
+    def findDynamicContacts(self):
         """
-        Resolves any static platform collisions.
+        Finds which moving entities are near each other.
+
+        :return: Dictionary, mapping each moving entity to a list of the
+        moving entities near it (in the order of the scene).
         """
-        for player in self.scene.players:
-            self._resolveBasicCollision(player, self.scene.sPlatforms)
+        contacts = {}
+        for a, b in sweepAndPrune(self.dynamics, self.CONTACT_MARGIN):
+            contacts.setdefault(a, []).append(b)
+            contacts.setdefault(b, []).append(a)
+        return contacts
 
-    def resolveDPlatformCollisions(self):
+    def findContacts(self, moving, dynamicContacts):
         """
-        Resolves any directional platform collisions.
+        Finds all the entities near a moving entity (including along its
+        movement during the last physics step) by their layer.
+
+        :param moving: GameObject instance, representing a moving scene entity.
+        :param dynamicContacts: Dictionary, mapping moving entities to the
+        moving entities near them (see findDynamicContacts).
+        :return: Dictionary, mapping layers to lists of the entities on them
+        (in the order they are resolved).
         """
-        for player in self.scene.players:
+        area = moving.rect
+        if moving.physics.previous:
+            area = area.union(pg.Rect(moving.physics.previous, area.size))
+        area = area.inflate(2*self.CONTACT_MARGIN, 2*self.CONTACT_MARGIN)
 
-            hits = pg.sprite.spritecollide(player, self.scene.dPlatforms, False)
-            for platform in hits:
-                direction = self._checkCollisionDirection(player, platform)
+        contacts = {}
+        for entity in self.grid.query(area) + dynamicContacts.get(moving, []):
+            layer = self.GROUP_LAYERS[self.entityToGroup[entity]]
+            contacts.setdefault(layer, []).append(entity)
 
-                if direction == "bottom":
-                    tol = abs(player.rect.bottom - platform.rect.top)
-                    if tol < 30:
-                        player.rect.bottom = platform.rect.top
-                        player.isOnGround = True
+        if PROFILER.isEnabled:
+            PROFILER.count("collision_checks", self.grid.lastChecked)
+        return contacts
 
-                        # Allows conversation of velocity if the player jumps through
-                        if player.physics.velocity.y > 0:
-                            player.physics.velocity.y = 0
+    def resolveContacts(self, moving, layer, contacts):
+        """
+        Dispatches the contacts of a moving entity to the responses of its
+        layer, layer by layer.
 
-    def resolveMPlatformCollisions(self):
+        :param moving: GameObject instance, representing a moving scene entity.
+        :param layer: String, the collision layer of the moving entity.
+        :param contacts: Dictionary, mapping layers to lists of the entities
+        on them (see findContacts).
         """
-        Resolves any moving platform collisions.
+        isAsleep = moving.physics.isAsleep
+        for other, respond in self.layerToResponses[layer]:
+            if isAsleep and other in self.AWAKE_LAYERS:
+                continue
+            respond(moving, contacts)
+
+    def resolveExit(self, moving, group, other):
         """
-        for player in self.scene.players:
-            hits = pg.sprite.spritecollide(player, self.scene.mPlatforms, False)
-            self._resolveBasicCollision(player, self.scene.mPlatforms)
+        Dispatches a moving entity no longer overlapping another entity to
+        the exit handler of their layers.
 
-            for platform in hits:
-                player.physics.addDisplacementX("platform", platform.dx)
-                player.physics.addDisplacementY("platform", platform.dy)
+        :param moving: GameObject instance, representing a moving scene entity.
+        :param group: String, the name of the list of the scene the other
+        entity is in.
+        :param other: GameObject instance, representing the entity exited.
+        """
+        layers = (self.GROUP_LAYERS[self.entityToGroup[moving]],
+                  self.GROUP_LAYERS[group])
+        if layers in self.layersToExit:
+            self.layersToExit[layers](moving, group, other)
 
-    def resolveSwitchCollisions(self):
+    def resolvePlayerCollisions(self, explosionSpeed):
         """
-        Resolves any switch collisions.
+        Resolves any collisions between players.
+
+        :param explosionSpeed: Integer, the speed at which colliding players
+        fly away from each other in the x-axis and y-axis respectively.
         """
-        switchesOn = [s for s in self.scene.switches if s.isOn]
-        for s in switchesOn:
+        for p1, p2 in sweepAndPrune(self.scene.players):
+            p1.physics.addVelocityY("collision", -explosionSpeed)
+            p2.physics.addVelocityY("collision", -explosionSpeed)
 
-            for player in self.scene.players:
-                if pg.sprite.collide_rect(player, s):
-                    if (player.physics.velocity.x != 0 or
-                            player.physics.velocity.y != 0):
-                        s.turnOff()
+            if p2.rect.x > p1.rect.x:
+                p1.physics.addVelocityX("collision", -explosionSpeed)
+                p2.physics.addVelocityX("collision", explosionSpeed)
+
+            else:
+                p1.physics.addVelocityX("collision", explosionSpeed)
+                p2.physics.addVelocityX("collision", -explosionSpeed)
 
     def resolveDoorCollisions(self):
         """
         Resolves any door collisions.
         """
-        for player in self.scene.players:
+        isAtDoor = any(self.playerToDoors.values())
+        if isAtDoor and not any(d.isClosed for d in self.scene.doors):
+            self.messageScene("complete")
 
-            hits = pg.sprite.spritecollide(player, self.scene.doors, False)
-            doorsClosed = [d for d in self.scene.doors if d.isClosed]
-            if hits and not doorsClosed:
-                self.messageScene("complete")
+    def _respondToSolid(self, player, contacts):
+        """
+        Stops a player from passing through any blocks, first along its
+        movement during the last physics step (so that fast players cannot
+        pass through blocks) and then wherever it still overlaps them.
 
-    def resolveSpikeCollisions(self):
+        :param player: GameObject instance, representing a player.
+        :param contacts: Dictionary, mapping layers to lists of the entities
+        near the player.
         """
-        Resolves any spike collisions.
+        self._resolveSweptCollision(player,
+                                    contacts.get("solid", []),
+                                    contacts.get("one_way", []))
+        hits = self._touching(player, contacts, "solid")
+        self._resolveBasicCollision(player, hits)
+
+    def _respondToOneWay(self, player, contacts):
         """
-        for player in self.scene.players:
+        Lands a player on any directional platforms it has fallen onto.
 
-            hits = pg.sprite.spritecollide(player, self.scene.spikes, False)
-            if hits:
-                self.messageScene("death", player.num)
+        :param player: GameObject instance, representing a player.
+        :param contacts: Dictionary, mapping layers to lists of the entities
+        near the player.
+        """
+        for platform in self._touching(player, contacts, "one_way"):
+            direction = self._checkCollisionDirection(player, platform)
+
+            if direction == "bottom":
+                tol = abs(player.rect.bottom - platform.rect.top)
+                if tol < 30:
+                    player.rect.bottom = platform.rect.top
+                    player.isOnGround = True
+
+                    # Allows conversation of velocity if the player jumps through
+                    if player.physics.velocity.y > 0:
+                        player.physics.velocity.y = 0
 
-    def resolveBossCollisions(self):
+    def _respondToCarrier(self, player, contacts):
         """
-        Resolves any boss collisions.
+        Stops a player from passing through any moving platforms, and carries
+        it along with them.
+
+        :param player: GameObject instance, representing a player.
+        :param contacts: Dictionary, mapping layers to lists of the entities
+        near the player.
         """
-        for player in self.scene.players:
+        hits = self._touching(player, contacts, "carrier")
+        self._resolveBasicCollision(player, hits)
 
-            hits = pg.sprite.spritecollide(player, self.scene.bosses, False)
-            if hits:
-                self.messageScene("death", player.num)
+        for platform in hits:
+            player.physics.addDisplacementX("platform", platform.dx)
+            player.physics.addDisplacementY("platform", platform.dy)
 
-    def resolveBoundaryCollision(self):
+    def _respondToTrigger(self, player, contacts):
         """
-        Checks if the players have 'fallen' out of the level.
+        Resolves a player overlapping any switches or doors, where a switch
+        is turned off by a player moving through it.
+
+        :param player: GameObject instance, representing a player.
+        :param contacts: Dictionary, mapping layers to lists of the entities
+        near the player.
         """
-        w, h = self.scene.rect.size
-        boundary = pg.Rect(-1000, -1000, w+2000, h+2000)
+        for trigger in self._touching(player, contacts, "trigger"):
+            isEntering = self._overlap(player, trigger)
+
+            if self.entityToGroup[trigger] == "doors" and isEntering:
+                self._enter(self.playerToDoors, player)
+            if self.entityToGroup[trigger] == "switches" and trigger.isOn:
+                if (player.physics.velocity.x != 0 or
+                        player.physics.velocity.y != 0):
+                    trigger.turnOff()
+
+    def _respondToHazard(self, player, contacts):
+        """
+        Kills a player starting to overlap any spikes or bosses, unless it
+        already overlaps others (e.g. moving from one spike onto the next).
+
+        :param player: GameObject instance, representing a player.
+        :param contacts: Dictionary, mapping layers to lists of the entities
+        near the player.
+        """
+        for hazard in self._touching(player, contacts, "hazard"):
+            if self._overlap(player, hazard):
+                if self._enter(self.playerToHazards, player):
+                    self.messageScene("death", player.num)
+
+    def _exitTrigger(self, player, group, trigger):
+        """
+        Handles a player no longer overlapping a switch or a door.
+
+        :param player: GameObject instance, representing a player.
+        :param group: String, the name of the list of the scene the trigger
+        is in.
+        :param trigger: GameObject instance, representing the trigger.
+        """
+        if group == "doors":
+            self._exit(self.playerToDoors, player)
+
+    def _exitHazard(self, player, group, hazard):
+        """
+        Handles a player no longer overlapping a spike or a boss, so that
+        touching a hazard again kills it again.
+
+        :param player: GameObject instance, representing a player.
+        :param group: String, the name of the list of the scene the hazard
+        is in.
+        :param hazard: GameObject instance, representing the hazard.
+        """
+        self._exit(self.playerToHazards, player)
+
+    def _respondToBoundary(self, player, contacts):
+        """
+        Kills a player that has 'fallen' out of the level.
 
-        for player in self.scene.players:
-            if not pg.Rect.contains(boundary, player):
+        :param player: GameObject instance, representing a player.
+        :param contacts: Dictionary, mapping layers to lists of the entities
+        near the player.
+        """
+        if not self.boundary.contains(player.rect):
+            if player not in self.playersOutside:
+                self.playersOutside.add(player)
                 self.messageScene("death", player.num)
+        else:
+            self.playersOutside.discard(player)
+
+    def _overlap(self, player, trigger):
+        """
+        Remembers that a player overlaps a trigger during this physics step.
+
+        :param player: GameObject instance, representing a player.
+        :param trigger: GameObject instance, representing the trigger.
+        :return: Boolean, whether the player has started overlapping it.
+        """
+        overlap = (player, self.entityToGroup[trigger], trigger)
+        self.overlaps.append(overlap)
+        return overlap not in self.lastOverlapSet
+
+    @staticmethod
+    def _enter(counts, player):
+        """
+        Counts a player entering one more entity of a kind.
+
+        :param counts: Dictionary, mapping players to how many entities of
+        the kind they overlap.
+        :param player: GameObject instance, representing a player.
+        :return: Boolean, whether the player did not overlap any before.
+        """
+        counts[player] = counts.get(player, 0) + 1
+        return counts[player] == 1
 
-    def _resolveBasicCollision(self, moving, group):
+    @staticmethod
+    def _exit(counts, player):
+        """
+        Counts a player exiting one entity of a kind.
+
+        :param counts: Dictionary, mapping players to how many entities of
+        the kind they overlap.
+        :param player: GameObject instance, representing a player.
+        """
+        if counts.get(player, 0) > 1:
+            counts[player] -= 1
+        else:
+            counts.pop(player, None)
+
+    def _resolveBasicCollision(self, moving, hits):
         """
         Resolves any collisions between a moving object and a group of
         objects such that the moving object cannot pass through such objects.
 
         :param moving: GameObject instance, representing a moving scene entity.
-        :param group: List, containing GameObject instance in a scene.
+        :param hits: List, containing the objects colliding with the moving
+        object.
         :return:
         """
-        hits = pg.sprite.spritecollide(moving, group, False)
-
         for wall in hits:
             direction = self._checkCollisionDirection(moving, wall)
 
@@ -211,56 +575,195 @@ class CollisionEngine(GameObject):
                 moving.rect.right = wall.rect.left
                 moving.physics.velocity.x = 0
 
+    def _resolveSweptCollision(self, moving, solids, oneWays):
+        """
+        Sweeps the movement of a moving object during the last physics step
+        against the given static objects, and stops it at the earliest time
+        of impact.
+
+        At most two impacts are resolved since the movement along an axis is
+        stopped after every impact.
+
+        :param moving: GameObject instance, representing a moving scene entity.
+        :param solids: List, containing the objects near the moving object
+        that cannot be passed through from any direction.
+        :param oneWays: List, containing the objects near the moving object
+        that can only be landed on from above.
+        """
+        if not moving.physics.previous:
+            return
+
+        x, y = moving.physics.previous
+        xEnd, yEnd, w, h = moving.rect
+
+        for _ in range(2):
+            dx = xEnd - x
+            dy = yEnd - y
+            if dx == 0 and dy == 0:
+                break
+
+            path = pg.Rect(min(x, xEnd), min(y, yEnd), w+abs(dx), h+abs(dy))
+            start = pg.Rect(x, y, w, h)
+
+            impact = None
+            for static in self._within(path, solids):
+                hit = self._computeTimeOfImpact(start, dx, dy, static.rect)
+                if hit and (not impact or hit[0] < impact[0]):
+                    impact = hit + (static,)
+
+            if dy > 0:
+                for static in self._within(path, oneWays):
+                    hit = self._computeTimeOfImpact(start, dx, dy, static.rect)
+                    if (hit and hit[1] == "y" and
+                            (not impact or hit[0] < impact[0])):
+                        impact = hit + (static,)
+
+            if not impact:
+                break
+
+            time, axis, static = impact
+            if axis == "x":
+                x = static.rect.left - w if dx > 0 else static.rect.right
+                y += dy*time
+                xEnd = x
+                moving.physics.velocity.x = 0
+            else:
+                y = static.rect.top - h if dy > 0 else static.rect.bottom
+                x += dx*time
+                yEnd = y
+                moving.physics.velocity.y = 0
+                if dy > 0:
+                    moving.isOnGround = True
+
+        moving.rect.topleft = (xEnd, yEnd)
+
+    def _within(self, area, objects):
+        """
+        Finds the objects colliding with an area.
+
+        :param area: pygame.Rect, the area to search.
+        :param objects: List, containing the objects to search through.
+        :return: List, containing the objects colliding with the area.
+        """
+        return [o for o in objects if area.colliderect(o.rect)]
+
+    def _computeTimeOfImpact(self, start, dx, dy, static):
+        """
+        Computes when a moving box first touches a static box (i.e. a swept
+        axis-aligned bounding box test).
+
+        :param start: pygame.Rect, the moving box at the start of movement.
+        :param dx: Number, the movement along the x-axis.
+        :param dy: Number, the movement along the y-axis.
+        :param static: pygame.Rect, the static box.
+        :return: 2-Tuple, containing the fraction of the movement completed
+        at impact and the axis ('x' or 'y') of the impact, or None if the
+        boxes do not meet (or already overlapped at the start).
+        """
+        xEntry, xExit = self._computeAxisTimes(start.left, start.right,
+                                               static.left, static.right, dx)
+        yEntry, yExit = self._computeAxisTimes(start.top, start.bottom,
+                                               static.top, static.bottom, dy)
+
+        entry = max(xEntry, yEntry)
+        exit = min(xExit, yExit)
+        if entry >= exit or not 0 <= entry <= 1:
+            return None
+
+        if xEntry > yEntry:
+            return entry, "x"
+        return entry, "y"
+
+    def _computeAxisTimes(self, moveMin, moveMax, staticMin, staticMax, d):
+        """
+        Computes when the moving box starts and stops overlapping the static
+        box along a single axis.
+
+        :param moveMin: Number, the lowest coordinate of the moving box.
+        :param moveMax: Number, the highest coordinate of the moving box.
+        :param staticMin: Number, the lowest coordinate of the static box.
+        :param staticMax: Number, the highest coordinate of the static box.
+        :param d: Number, the movement along the axis.
+        :return: 2-Tuple, containing the entry and exit fractions of the
+        movement.
+        """
+        if d > 0:
+            return (staticMin - moveMax)/d, (staticMax - moveMin)/d
+        if d < 0:
+            return (staticMax - moveMin)/d, (staticMin - moveMax)/d
+        if moveMin < staticMax and moveMax > staticMin:
+            return float("-inf"), float("inf")
+        return float("inf"), float("-inf")
+
+    def _touching(self, moving, contacts, layer):
+        """
+        Finds the entities on a layer that the moving object is touching.
+
+        :param moving: GameObject instance, representing a moving scene entity.
+        :param contacts: Dictionary, mapping layers to lists of the entities
+        near the moving object.
+        :param layer: String, the collision layer to search.
+        :return: List, containing the entities touched (in the order they are
+        resolved).
+        """
+        hits = self._within(moving.rect, contacts.get(layer, []))
+        if layer in self.PRECISE_LAYERS:
+            hits = [h for h in hits if self._collideMask(moving, h)]
+        return hits
+
+    def _collideMask(self, moving, static):
+        """
+        Checks if the hit box of the moving object overlaps the opaque pixels
+        of the static object, once their rects are known to collide.
+
+        :param moving: GameObject instance, representing a moving scene entity.
+        :param static: GameObject instance, having a render component.
+        :return: Boolean, whether the objects collide.
+        """
+        # The mask is of the image drawn at the top left of the rect
+        mask = static.render.mask
+
+        # The hit box of a moving object is its whole rect
+        size = moving.rect.size
+        try:
+            hitBox = self.sizeToMask[size]
+        except KeyError:
+            hitBox = self.sizeToMask[size] = pg.mask.Mask(size)
+            hitBox.fill()
+
+        if PROFILER.isEnabled:
+            PROFILER.count("mask_checks")
+
+        offset = (static.rect.x - moving.rect.x, static.rect.y - moving.rect.y)
+        return hitBox.overlap(mask, offset) is not None
+
     def _checkCollisionDirection(self, moving, static):
         """
         Checks if the moving game object has collided with the static game
         object, and determines the direciton of collision.
 
+        The direction is found by comparing the angle from the center of the
+        moving game object to the center of the static game object against
+        the angles to the corners of the static game object.
+
         :param moving: GameObject instance, representing a moving game object.
         :param static: GameObject instance, representing a static game object.
         :return: String, whether 'bottom', 'left', 'top', or 'right'.
         """
-        if pg.sprite.collide_rect(moving, static):
-            # Defining points on the static game object
+        if moving.rect.colliderect(static.rect):
             x, y = static.rect.center
-            S00 = static.rect.topleft
-            S10 = static.rect.topright
-            S11 = static.rect.bottomright
-            S01 = static.rect.bottomleft
-
-            # Defining points on the moving game object
             u, v = moving.rect.center
-            M00 = moving.rect.topleft
-            M10 = moving.rect.topright
-            M11 = moving.rect.bottomright
-            M01 = moving.rect.bottomleft
-
-            # Defining vectors on the static game object which will be used in
-            # accurate collision handling. The vectors are from the center of
-            # the game object to its corners.
-            vec_M00 = Vector2(x - S00[0], y - S00[1])
-            vec_M10 = Vector2(x - S10[0], y - S10[1])
-            vec_M11 = Vector2(x - S11[0], y - S11[1])
-            vec_M01 = Vector2(x - S01[0], y - S01[1])
-
-            # Defining variables for our new coordinate system based on angles
-            # (which is mathematically equivalent to bearings)
-            FULL_ROTATION = 360
-            origin = vec_M00
-
-            # Calculating angles of the static game object vectors
-            angle_00 = origin.angle_to(vec_M00) % FULL_ROTATION
-            angle_10 = origin.angle_to(vec_M10) % FULL_ROTATION
-            angle_11 = origin.angle_to(vec_M11) % FULL_ROTATION
-            angle_01 = origin.angle_to(vec_M01) % FULL_ROTATION
+            angle_10, angle_11, angle_01, origin = \
+                self._computeCornerAngles(static.rect)
 
             # Calculating the displacement angle between the moving and
             # static game objects
-            displacement = Vector2(x - u, y - v)
-            angle = origin.angle_to(displacement) % FULL_ROTATION
+            angle = ((math.atan2(y - v, x - u) - origin) *
+                     180.0 / math.pi) % FULL_ROTATION
 
-            # Calculating direction of the collision
-            isCollideBottom = angle_00 < angle < angle_10
+            # Calculating direction of the collision (the angle to the
+            # top left corner is zero since it is the origin)
+            isCollideBottom = 0 < angle < angle_10
             isCollideLeft = angle_10 < angle < angle_11
             isCollideTop = angle_11 < angle < angle_01
             isCollideRight = angle_01 < angle
@@ -273,3 +776,49 @@ class CollisionEngine(GameObject):
                 return "top"
             elif isCollideRight:
                 return "right"
+
+    def _computeCornerAngles(self, rect):
+        """
+        Computes the angles of the vectors from the center of a rect to its
+        corners, measured from the vector to the top left corner (which is
+        mathematically equivalent to bearings).
+
+        The angles only depend on the size of the rect, hence they are
+        cached for each size.
+
+        :param rect: pygame.Rect, the rect of a static game object.
+        :return: 4-Tuple, containing the angles in degrees to the top right,
+        bottom right and bottom left corners, and the angle of the origin
+        vector in radians.
+        """
+        size = rect.size
+        try:
+            return self.sizeToCornerAngles[size]
+        except KeyError:
+            pass
+
+        # The vectors are from the corners to the center of the rect
+        x, y = rect.center
+        origin = math.atan2(y - rect.top, x - rect.left)
+        corners = [rect.topright, rect.bottomright, rect.bottomleft]
+        angles = [((math.atan2(y - cy, x - cx) - origin) *
+                   180.0 / math.pi) % FULL_ROTATION
+                  for cx, cy in corners]
+
+        self.sizeToCornerAngles[size] = tuple(angles) + (origin,)
+        return self.sizeToCornerAngles[size]
+
+
+class Collider:
+    """
+    A box that only takes part in collisions, standing in for (parts of) the
+    scene entities that it covers.
+    """
+
+    __slots__ = ("rect",)
+
+    def __init__(self, rect):
+        """
+        :param rect: pygame.Rect, the area covered.
+        """
+        self.rect = rect
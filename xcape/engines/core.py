@@ -20,6 +20,9 @@ from xcape.common.loader import ICON_RESOURCES
 pg.display.set_icon(ICON_RESOURCES["assets"]["red"][0])
 
 from xcape.common.object import GameObject
+from xcape.common.profiler import PROFILER
+from xcape.common.router import EventRouter
+from xcape.components.overlay import PerformanceOverlay
 from xcape.engines.cutscene import CutSceneEngine
 from xcape.engines.menu import MenuEngine
 from xcape.engines.scene import SceneEngine
@@ -30,7 +33,9 @@ class CoreEngine(GameObject):
     Responsibilities:
         - Displaying and updating the scene engine.
         - Displaying and updating the menu engine.
-        - Pulling out events from the event queue and passing them down.
+        - Pulling out events from the event queue and routing them to the
+          engines interested in them.
+        - Displaying the performance overlay above everything else.
     """
 
     def __init__(self):
@@ -42,6 +47,21 @@ class CoreEngine(GameObject):
         self.sceneEngine = SceneEngine(self.screen)
         self.menuEngine = MenuEngine(self.screen)
         self.cutsceneEngine = CutSceneEngine(self.screen)
+        self.overlay = PerformanceOverlay(self.screen)
+
+        self.router = EventRouter()
+        self.router.subscribe(self.quit, pg.QUIT)
+        self.router.subscribe(self.quit, pg.KEYDOWN, [pg.K_F4])
+
+        self.router.subscribe(self.overlay.handleEvent, self.MENU_EVENT)
+        self.router.subscribe(self.overlay.handleEvent, pg.KEYDOWN,
+                              [pg.K_F3])
+
+        # The engines subscribe to the keys themselves, only while they are
+        # showing a menu, running a mode or playing a cutscene
+        self.menuEngine.subscribe(self.router)
+        self.sceneEngine.subscribe(self.router)
+        self.cutsceneEngine.subscribe(self.router)
 
         self.messageMenu("transition", "splash_menu")
         # self.messageScene("start_game", "solo")
@@ -53,40 +73,30 @@ class CoreEngine(GameObject):
 
     def handleEvent(self, _):
         for event in pg.event.get():
-
-            if event.type == pg.QUIT:
-                sys.exit()
-            if event.type == pg.KEYDOWN:
-                if event.key == pg.K_F4:
-                    sys.exit()
-
-            if (event.type == self.MENU_EVENT
-                    or event.type == pg.KEYDOWN):
-                self.menuEngine.handleEvent(event)
-
-            if (event.type == self.SCENE_EVENT
-                    or event.type == pg.KEYDOWN
-                    or event.type == pg.KEYUP):
-                self.sceneEngine.handleEvent(event)
-
-            if (event.type == self.CUTSCENE_EVENT
-                    or event.type == pg.KEYDOWN):
-                self.cutsceneEngine.handleEvent(event)
+            self.router.route(event)
 
     def update(self):
-        self.sceneEngine.update()
-        self.menuEngine.update()
-        self.cutsceneEngine.update()
+        PROFILER.timed("scene_engine_update", self.sceneEngine.update)
+        PROFILER.timed("menu_engine_update", self.menuEngine.update)
+        PROFILER.timed("cutscene_engine_update", self.cutsceneEngine.update)
 
     def draw(self, camera=None):
-        self.sceneEngine.draw()
-        self.menuEngine.draw()
-        self.cutsceneEngine.draw()
+        PROFILER.timed("scene_engine_draw", self.sceneEngine.draw)
+        PROFILER.timed("menu_engine_draw", self.menuEngine.draw)
+        PROFILER.timed("cutscene_engine_draw", self.cutsceneEngine.draw)
+        self.overlay.draw()
         pg.display.update()
 
+    def quit(self, _=None):
+        """
+        Quits the game.
+        """
+        sys.exit()
+
     def run(self):
         while self.running:
             self.handleEvent(None)
             self.update()
             self.draw()
-            self.clock.tick(settings.FPS)
+            frameTime = self.clock.tick(settings.FPS)
+            PROFILER.endFrame(frameTime)
@@ -20,6 +20,7 @@ class CutSceneEngine(GameObject):
         :param screen: pygame.Surface, representing the screen.
         """
         self.screen = screen
+        self.router = None
 
         self.cutscene = None
         self.nameToCutscene = \
@@ -42,6 +43,7 @@ class CutSceneEngine(GameObject):
                     self.cutscene = cutscene(self.screen)
                 except TypeError:
                     self.cutscene = cutscene
+                self._subscribeKeys()
 
             if event.category == "screen":
                 self.screen = pg.display.get_surface()
@@ -53,3 +55,25 @@ class CutSceneEngine(GameObject):
     def draw(self, camera=None):
         if self.cutscene:
             self.cutscene.draw()
+
+    def subscribe(self, router):
+        """
+        Subscribes the cutscene engine to the cutscene events and, while a
+        cutscene plays, to the keys handled by the cutscene.
+
+        :param router: EventRouter instance, delivering the events of the game.
+        """
+        self.router = router
+        router.subscribe(self.handleEvent, self.CUTSCENE_EVENT)
+        self._subscribeKeys()
+
+    def _subscribeKeys(self):
+        """
+        Subscribes the cutscene engine to the keys handled by the current
+        cutscene only, in place of those handled by the previous cutscene.
+        """
+        if self.router:
+            self.router.unsubscribe(self.handleEvent, pg.KEYDOWN)
+            if self.cutscene:
+                self.router.subscribe(self.handleEvent, pg.KEYDOWN,
+                                      self.cutscene.KEYS)
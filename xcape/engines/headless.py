@@ -0,0 +1,138 @@
+"""
+Responsible for running the game without a window.
+
+The SDL dummy drivers are selected upon importing this module, so it must be
+imported before the core engine (which initialises pygame on import).
+
+The animations of the game are driven by the pygame clock, so frames are only
+reproducible (e.g. for golden image hashes) for content that is not animated
+or when the frames are captured at the same points in time.
+"""
+
+import hashlib
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame as pg
+
+import xcape.common.settings as settings
+from xcape.common.object import GameObject
+from xcape.engines.core import CoreEngine
+
+
+def frameToBytes(surface):
+    """
+    Converts the given surface into a buffer of RGB bytes.
+
+    :param surface: pygame.Surface, the composed frame.
+    :return: Bytes, containing the pixels of the frame row by row.
+    """
+    return pg.image.tostring(surface, "RGB")
+
+
+def frameToArray(surface):
+    """
+    Converts the given surface into a NumPy array.
+
+    NumPy is an optional dependency, hence an ImportError is raised if it is
+    not installed.
+
+    :param surface: pygame.Surface, the composed frame.
+    :return: numpy.ndarray, of shape (width, height, 3) containing RGB pixels.
+    """
+    import pygame.surfarray
+    return pygame.surfarray.array3d(surface)
+
+
+def frameHash(surface):
+    """
+    Hashes the pixels of the given surface, which allows detecting rendering
+    regressions by comparing against a previously recorded hash.
+
+    :param surface: pygame.Surface, the composed frame.
+    :return: String, the SHA-1 hex digest of the frame.
+    """
+    return hashlib.sha1(frameToBytes(surface)).hexdigest()
+
+
+class HeadlessRenderer(GameObject):
+    """
+    Runs game objects frame by frame and captures each composed frame.
+    """
+
+    def __init__(self, capture=frameToBytes):
+        """
+        :param capture: Function, converting a pygame.Surface into the
+        captured frame, or None to skip capturing (e.g. for benchmarks).
+        """
+        self.capture = capture
+        self.screen = pg.display.get_surface()
+
+    def __str__(self):
+        return "headless_renderer"
+
+    def renderCore(self, frames, core=None):
+        """
+        Runs the core engine for the given number of frames.
+
+        The frames are run back to back without being limited to the FPS.
+
+        :param frames: Integer, the number of frames to run.
+        :param core: CoreEngine instance, or None to create a new one.
+        :return: List, containing the captured frames.
+        """
+        if not core:
+            core = CoreEngine()
+
+        captured = []
+        for _ in range(frames):
+            core.handleEvent(None)
+            core.update()
+            core.draw()
+            self._capture(core.screen, captured)
+        return captured
+
+    def render(self, gameObject, frames, camera=None, physicsWorld=None):
+        """
+        Runs any game object that follows the update and draw(camera)
+        contract (e.g. a scene, menu or cutscene) for the given number of
+        frames.
+
+        The events posted by the game object are passed back to it, so that
+        e.g. doors in a scene still react to switches. The physics world is
+        stepped as if every frame took exactly its share of the FPS, which
+        keeps the physics reproducible between runs.
+
+        :param gameObject: GameObject instance, the object to render.
+        :param frames: Integer, the number of frames to run.
+        :param camera: SimpleCamera instance, the camera to draw with.
+        :param physicsWorld: PhysicsWorld instance, stepping the bodies of
+        the game object.
+        :return: List, containing the captured frames.
+        """
+        captured = []
+        for _ in range(frames):
+            for event in pg.event.get():
+                gameObject.handleEvent(event)
+
+            gameObject.update()
+            if physicsWorld:
+                physicsWorld.update(1000 / settings.FPS)
+            if camera:
+                camera.update()
+
+            gameObject.draw(camera)
+            self._capture(gameObject.screen, captured)
+        return captured
+
+    def _capture(self, surface, captured):
+        """
+        Captures the given surface if capturing is enabled.
+
+        :param surface: pygame.Surface, the composed frame.
+        :param captured: List, to append the captured frame to.
+        """
+        if self.capture:
+            captured.append(self.capture(surface))
@@ -21,6 +21,7 @@ class MenuEngine(GameObject):
         """
         super().__init__()
         self.screen = screen
+        self.router = None
 
         self.menu = None
         self.nameToMenu = \
@@ -49,6 +50,7 @@ class MenuEngine(GameObject):
                     self.menu = menu(self.screen)
                 except TypeError:
                     self.menu = menu
+                self._subscribeKeys()
 
             if event.category == "screen":
                 self.screen = pg.display.get_surface()
@@ -60,3 +62,25 @@ class MenuEngine(GameObject):
     def draw(self, camera=None):
         if self.menu:
             self.menu.draw()
+
+    def subscribe(self, router):
+        """
+        Subscribes the menu engine to the menu events and, while a menu is
+        shown, to the keys handled by the menu.
+
+        :param router: EventRouter instance, delivering the events of the game.
+        """
+        self.router = router
+        router.subscribe(self.handleEvent, self.MENU_EVENT)
+        self._subscribeKeys()
+
+    def _subscribeKeys(self):
+        """
+        Subscribes the menu engine to the keys handled by the current menu
+        only, in place of those handled by the previous menu.
+        """
+        if self.router:
+            self.router.unsubscribe(self.handleEvent, pg.KEYDOWN)
+            if self.menu:
+                self.router.subscribe(self.handleEvent, pg.KEYDOWN,
+                                      self.menu.KEYS)
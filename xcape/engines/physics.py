@@ -0,0 +1,341 @@
+"""
+The physics engine of the game.
+"""
+
+import pygame as pg
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import xcape.common.settings as settings
+from xcape.common.object import GameObject
+from xcape.components.physics import PhysicsComponent
+
+
+class PhysicsWorld(GameObject):
+    """
+    Owns all the physics bodies in a scene and steps them together.
+
+    The time elapsed between frames is accumulated and consumed in fixed
+    timesteps, so that physics is deterministic and independent of the frame
+    rate. Slow frames are caught up by taking several steps in a single
+    frame, up to a limit so that the game cannot spiral into taking more and
+    more steps.
+
+    The bodies are either stepped one by one, or all together using NumPy
+    arrays (an optional dependency) which suits scenes with many bodies.
+    Bodies resting on the ground are put to sleep after every step, and are
+    skipped until they are woken up. Dormant bodies are skipped too.
+
+    Game objects with a prestep method (e.g. moving platforms turning around
+    at the ends of their path) have it called before every step.
+    """
+
+    # The order in which the bodies of a scene are stepped. Moving platforms
+    # are stepped first so that players ride them without lagging behind.
+    SCENE_BODIES = [
+        "mPlatforms",
+        "players",
+        "bosses",
+    ]
+
+    def __init__(self, collisionEngine=None, maxSteps=5, isVectorised=False):
+        """
+        :param collisionEngine: CollisionEngine instance, resolving collisions
+        after every physics step.
+        :param maxSteps: Integer, the most physics steps taken in a frame.
+        :param isVectorised: Boolean, whether to step the bodies using NumPy.
+        """
+        self.collisionEngine = collisionEngine
+        self.bodies = []
+        self.preStepped = []
+
+        self.backend = None
+        if isVectorised:
+            self.backend = ArrayBackend()
+
+        # Units are in milliseconds
+        self.timestep = 1000 / settings.PHYSICS_FPS
+        self.accumulator = 0.0
+        self.origin = None
+
+        self.maxSteps = maxSteps
+        self.steps = 0
+
+    def __str__(self):
+        return "physics_world"
+
+    def handleEvent(self, event):
+        pass
+
+    def update(self, dt=None):
+        """
+        Steps the physics as many times as the elapsed time allows.
+
+        :param dt: Number, the milliseconds elapsed since the last update, or
+        None to measure it using the pygame clock.
+        """
+        now = pg.time.get_ticks()
+        if dt is None:
+            dt = 0 if self.origin is None else now - self.origin
+        self.origin = now
+        self.accumulator += dt
+
+        steps = 0
+        while self.accumulator >= self.timestep:
+            if steps == self.maxSteps:
+                self.accumulator = 0.0
+                break
+
+            self.step()
+            self.accumulator -= self.timestep
+            steps += 1
+
+    def step(self):
+        """
+        Advances all the bodies by a single physics step, then resolves the
+        resulting collisions.
+        """
+        for body in self.preStepped:
+            if not body.isDormant:
+                body.gameObject.prestep()
+
+        if self.backend:
+            self.backend.step()
+        else:
+            for body in self.bodies:
+                body.update()
+
+        if self.collisionEngine:
+            self.collisionEngine.update()
+
+        if self.backend:
+            self.backend.settle()
+        else:
+            for body in self.bodies:
+                body.settle()
+
+        self.steps += 1
+
+    def add(self, physics):
+        """
+        Adds a body to be stepped.
+
+        :param physics: PhysicsComponent instance, representing the body.
+        """
+        self.bodies.append(physics)
+        if self.backend:
+            self.backend.add(physics)
+        if hasattr(physics.gameObject, "prestep"):
+            self.preStepped.append(physics)
+
+    def remove(self, physics):
+        """
+        Removes a body so that it is no longer stepped.
+
+        :param physics: PhysicsComponent instance, representing the body.
+        """
+        self.bodies.remove(physics)
+        if self.backend:
+            self.backend.remove(physics)
+        if physics in self.preStepped:
+            self.preStepped.remove(physics)
+
+    def addScene(self, scene):
+        """
+        Adds the bodies of all the physics driven entities in a scene.
+
+        :param scene: Scene Class, representing a level.
+        """
+        for name in self.SCENE_BODIES:
+            for entity in getattr(scene, name):
+                self.add(entity.physics)
+
+    def resetClock(self):
+        """
+        Discards the time elapsed so far (e.g. while the game was paused), so
+        that it is not caught up on the next update.
+        """
+        self.origin = None
+        self.accumulator = 0.0
+
+
+class ArrayBackend:
+    """
+    Steps physics bodies all together using NumPy arrays.
+
+    The backend owns the arrays holding the state and the channels of its
+    bodies (one row per body), and the bodies read and write their own rows
+    in place, so that gravity, speed limiting, integration and putting the
+    bodies to sleep each run as a single vectorised operation regardless of
+    the number of bodies. Only the rects of the game objects are read per
+    body, and written for those that moved.
+
+    The order of operations is the same as in PhysicsComponent.update.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        :param capacity: Integer, the number of bodies to allocate rows for,
+        doubled whenever it is exceeded.
+        """
+        if np is None:
+            raise ImportError("NumPy is required to step the physics bodies "
+                              "using arrays!")
+
+        self.bodies = []
+        self.state = np.zeros((capacity, PhysicsComponent.STATE_SIZE))
+        self.channels = np.zeros((4, capacity, len(PhysicsComponent.CHANNELS)))
+
+    def add(self, body):
+        """
+        Binds a body to the next free row of the arrays.
+
+        :param body: PhysicsComponent instance, representing the body.
+        """
+        if len(self.bodies) == len(self.state):
+            self._grow()
+
+        self._bind(body, len(self.bodies))
+        self.bodies.append(body)
+
+    def remove(self, body):
+        """
+        Unbinds a body, moving the last body into the row it leaves free.
+
+        :param body: PhysicsComponent instance, representing the body.
+        """
+        i = self.bodies.index(body)
+        body.unbind()
+
+        last = self.bodies.pop()
+        if last is not body:
+            self.bodies[i] = last
+            self._bind(last, i)
+
+    def step(self):
+        """
+        Advances all the bodies by a single physics step.
+        """
+        n = len(self.bodies)
+        if not n:
+            return
+
+        P = PhysicsComponent
+        state = self.state[:n]
+        velX, velY, disX, disY = self.channels[:, :n]
+        rects = self._gatherRects()
+
+        isDormant = state[:, P.IS_DORMANT] != 0
+        state[isDormant, P.DORMANT_STEPS] += 1
+
+        # Woken up if moved by something else since falling asleep
+        isMoved = ~isDormant & ((rects[:, 0] != state[:, P.PREVIOUS_X]) |
+                                (rects[:, 1] != state[:, P.PREVIOUS_Y]))
+        state[isMoved, P.IS_ASLEEP] = 0.0
+
+        active = ~isDormant & (state[:, P.IS_ASLEEP] == 0)
+        if not active.any():
+            return
+
+        # Takes over the position of the rect along the axes it was moved
+        for axis, rect in ((P.X, P.RECT_X), (P.Y, P.RECT_Y)):
+            column = rects[:, axis]
+            isAdopted = active & (column != state[:, rect])
+            state[isAdopted, axis] = column[isAdopted]
+            state[isAdopted, rect] = column[isAdopted]
+
+        state[active, P.PREVIOUS_X] = rects[active, 0]
+        state[active, P.PREVIOUS_Y] = rects[active, 1]
+        state[active, P.WAS_AT_REST] = ((state[active, P.VEL_X] == 0) &
+                                        (state[active, P.VEL_Y] == 0))
+
+        isGravity = active & (state[:, P.IS_GRAVITY] != 0)
+        velY[isGravity, P.CHANNELS["gravity"]] = state[isGravity, P.GRAVITY]
+
+        maxSpeed = state[active, P.MAX_SPEED]
+        vx = np.clip(state[active, P.VEL_X], -maxSpeed, maxSpeed)
+        vy = np.clip(state[active, P.VEL_Y], -maxSpeed, maxSpeed)
+        vx += velX[active].sum(axis=1)
+        vy += velY[active].sum(axis=1)
+        dx = disX[active].sum(axis=1)
+        dy = disY[active].sum(axis=1)
+        velX[active] = velY[active] = disX[active] = disY[active] = 0.0
+
+        x = state[active, P.X] + vx + dx
+        y = state[active, P.Y] + vy + dy
+        state[active, P.X] = x
+        state[active, P.Y] = y
+        state[active, P.VEL_X] = vx
+        state[active, P.VEL_Y] = vy
+        state[active, P.TRAVELLED] += (np.sqrt(vx*vx + vy*vy) +
+                                       np.sqrt(dx*dx + dy*dy))
+
+        # Moves the rects to the nearest pixels, writing only those that moved
+        rectX = np.floor(x + 0.5)
+        rectY = np.floor(y + 0.5)
+        state[active, P.RECT_X] = rectX
+        state[active, P.RECT_Y] = rectY
+
+        indices = np.flatnonzero(active)
+        isMoved = (rectX != rects[indices, 0]) | (rectY != rects[indices, 1])
+        for i, rx, ry in zip(indices[isMoved].tolist(),
+                             rectX[isMoved].tolist(),
+                             rectY[isMoved].tolist()):
+            self.bodies[i].gameObject.rect.topleft = (int(rx), int(ry))
+
+    def settle(self):
+        """
+        Puts to sleep all the bodies which stayed at rest on the ground
+        throughout the last physics step (see PhysicsComponent.settle).
+        """
+        n = len(self.bodies)
+        if not n:
+            return
+
+        P = PhysicsComponent
+        state = self.state[:n]
+        rects = self._gatherRects()
+        isOnGround = np.fromiter((getattr(b.gameObject, "isOnGround", False)
+                                  for b in self.bodies), dtype=bool, count=n)
+
+        state[:, P.IS_ASLEEP] = (isOnGround &
+                                 (state[:, P.WAS_AT_REST] != 0) &
+                                 (state[:, P.VEL_X] == 0) &
+                                 (state[:, P.VEL_Y] == 0) &
+                                 (rects[:, 0] == state[:, P.PREVIOUS_X]) &
+                                 (rects[:, 1] == state[:, P.PREVIOUS_Y]) &
+                                 ~self.channels[:, :n].any(axis=(0, 2)))
+
+    def _gatherRects(self):
+        """
+        :return: Array, the top-left corners of the rects of the bodies.
+        """
+        n = len(self.bodies)
+        rects = np.fromiter((c for b in self.bodies
+                             for c in b.gameObject.rect.topleft),
+                            dtype=float, count=2*n)
+        return rects.reshape(n, 2)
+
+    def _bind(self, body, i):
+        """
+        Binds a body to a row of the arrays.
+
+        :param body: PhysicsComponent instance, representing the body.
+        :param i: Integer, the row.
+        """
+        velX, velY, disX, disY = self.channels[:, i]
+        body.bind(self.state[i], velX, velY, disX, disY)
+
+    def _grow(self):
+        """
+        Doubles the capacity of the arrays, rebinding every body to its row
+        in the new arrays.
+        """
+        capacity = 2 * len(self.state)
+        self.state = np.zeros((capacity, self.state.shape[1]))
+        self.channels = np.zeros((4, capacity, self.channels.shape[2]))
+        for i, body in enumerate(self.bodies):
+            self._bind(body, i)
@@ -9,6 +9,7 @@ import xcape.components.solo as solo
 from xcape.common.object import GameObject
 from xcape.components.camera import SimpleCamera
 from xcape.engines.collision import CollisionEngine
+from xcape.engines.physics import PhysicsWorld
 
 
 class SceneEngine(GameObject):
@@ -23,6 +24,7 @@ class SceneEngine(GameObject):
         :param screen: pygame.Surface, representing the screen.
         """
         self.screen = screen
+        self.router = None
         self.mode = None
         self.pause = False
 
@@ -46,9 +48,11 @@ class SceneEngine(GameObject):
                 if event.data == "coop":
                     self.mode = MultiPlayer(self.screen)
                     self.mode.startGame()
+                self._subscribeKeys()
 
             if event.category == "no_mode":
                 self.mode = None
+                self._subscribeKeys()
             if event.category == "screen":
                 self.screen = pg.display.get_surface()
 
@@ -60,6 +64,30 @@ class SceneEngine(GameObject):
         if self.mode and not self.pause:
             self.mode.draw()
 
+    def subscribe(self, router):
+        """
+        Subscribes the scene engine to the scene events and, while a mode is
+        running, to the keys (which the scene of the mode routes on to the
+        objects subscribed to them).
+
+        :param router: EventRouter instance, delivering the events of the game.
+        """
+        self.router = router
+        router.subscribe(self.handleEvent, self.SCENE_EVENT)
+        self._subscribeKeys()
+
+    def _subscribeKeys(self):
+        """
+        Subscribes the scene engine to the keys if a mode is running, or
+        unsubscribes it from them otherwise.
+        """
+        if self.router:
+            for eventType in self.router.KEY_EVENTS:
+                if self.mode:
+                    self.router.subscribe(self.handleEvent, eventType)
+                else:
+                    self.router.unsubscribe(self.handleEvent, eventType)
+
 
 class SinglePlayer(GameObject):
 
@@ -72,6 +100,7 @@ class SinglePlayer(GameObject):
         self.scene = None
         self.camera = None
         self.collisionEngine = None
+        self.physicsWorld = None
         self.pause = False
 
         self.maxLives = 7
@@ -91,7 +120,6 @@ class SinglePlayer(GameObject):
         return "single_player"
 
     def handleEvent(self, event):
-        self.collisionEngine.eventHandler(event)
         self.scene.handleEvent(event)
 
         if event.type == pg.KEYDOWN:
@@ -114,12 +142,14 @@ class SinglePlayer(GameObject):
                     self.messageMenu("transition", "pause_menu")
             if event.category == "unpause":
                 self.pause = False
+                self.physicsWorld.resetClock()
                 self._loadUI(self.maxLives, self.lives)
 
     def update(self):
         if self.scene and not self.pause:
+            self.scene.focus(self.camera)
             self.scene.update()
-            self.collisionEngine.update()
+            self.physicsWorld.update()
             self.camera.update()
 
     def draw(self, camera=None):
@@ -134,10 +164,15 @@ class SinglePlayer(GameObject):
 
     def _restartScene(self):
         """
-        Restarts the current scene.
+        Restarts the current scene by resetting it in place, rather than
+        loading it again.
         """
-        num = self.scene.__class__.LEVEL_NUM
-        self._loadScene(self.numToScene[num])
+        self.scene.reset()
+        self.collisionEngine.reset()
+        self.physicsWorld.remove(self.camera.physics)
+        self.physicsWorld.resetClock()
+        self._loadCamera()
+        self.scene.focus(self.camera)
 
     def _nextScene(self):
         """
@@ -162,11 +197,24 @@ class SinglePlayer(GameObject):
         # properly. Namely, the UI SFX plays during cutscenes a bit.
         self._loadUI(self.maxLives, self.lives)
         self.scene = Scene(self.screen)
+        self.scene.snapshot()
         self.collisionEngine = CollisionEngine(self.scene)
+        self.collisionEngine.subscribe(self.scene.router)
 
+        self.physicsWorld = PhysicsWorld(self.collisionEngine)
+        self.physicsWorld.addScene(self.scene)
+        self._loadCamera()
+        self.scene.focus(self.camera)
+
+    def _loadCamera(self):
+        """
+        Loads a camera following the player, which briefly shows the exit of
+        the scene first.
+        """
         self.camera = SimpleCamera(settings.WIDTH, settings.HEIGHT)
         self.camera.follow(self.scene.players[0])
         self.camera.followBriefly(self.scene.doors[-1])
+        self.physicsWorld.add(self.camera.physics)
 
     def _loadUI(self, maxHealth, currentHealth):
         """
@@ -230,6 +278,7 @@ class MultiPlayer(GameObject):
         self.scene = None
         self.camera = None
         self.collisionEngine = None
+        self.physicsWorld = None
         self.pause = False
 
         self.maxLives = [5, 5]
@@ -244,7 +293,6 @@ class MultiPlayer(GameObject):
             }
 
     def handleEvent(self, event):
-        self.collisionEngine.eventHandler(event)
         self.scene.handleEvent(event)
 
         if event.type == pg.KEYDOWN:
@@ -272,12 +320,14 @@ class MultiPlayer(GameObject):
                     self.messageMenu("transition", "pause_menu")
             if event.category == "unpause":
                 self.pause = False
+                self.physicsWorld.resetClock()
                 self._loadUI(self.maxLives, self.lives)
 
     def update(self):
         if self.scene and not self.pause:
+            self.scene.focus(self.camera)
             self.scene.update()
-            self.collisionEngine.update()
+            self.physicsWorld.update()
             self.camera.update()
 
     def draw(self, camera=None):
@@ -302,10 +352,15 @@ class MultiPlayer(GameObject):
 
     def _restartScene(self):
         """
-        Restarts the current scene.
+        Restarts the current scene by resetting it in place, rather than
+        loading it again.
         """
-        num = self.scene.__class__.LEVEL_NUM
-        self._loadScene(self.numToScene[num])
+        self.scene.reset()
+        self.collisionEngine.reset()
+        self.physicsWorld.remove(self.camera.physics)
+        self.physicsWorld.resetClock()
+        self._loadCamera()
+        self.scene.focus(self.camera)
 
     # REFACTOR: Should input scene number instead, so that try-except
     # handling of the win menu is done within this method and not by the
@@ -317,12 +372,25 @@ class MultiPlayer(GameObject):
         :param Scene: BaseScene inheritor, representing a scene class.
         """
         self.scene = Scene(self.screen)
+        self.scene.snapshot()
         self.collisionEngine = CollisionEngine(self.scene)
+        self.collisionEngine.subscribe(self.scene.router)
+
+        self.physicsWorld = PhysicsWorld(self.collisionEngine)
+        self.physicsWorld.addScene(self.scene)
+        self._loadCamera()
+        self.scene.focus(self.camera)
 
+    def _loadCamera(self):
+        """
+        Loads a camera following the first player, which briefly shows the
+        exit of the scene first.
+        """
         self.camera = SimpleCamera(settings.WIDTH, settings.HEIGHT)
         self.camera.physics.maxSpeed = 30
         self.camera.follow(self.scene.players[0])
         self.camera.followBriefly(self.scene.doors[-1])
+        self.physicsWorld.add(self.camera.physics)
 
     def _loadUI(self, maxHealth, health):
         """
@@ -380,10 +448,11 @@ class MultiPlayer(GameObject):
 
     def _swapCameraFollow(self):
         """
-        Toggles the camera to follow between the two players.
+        Cycles the camera to follow the next player.
         """
-        p1, p2 = self.scene.players
-        if self.camera.following == p1:
-            self.camera.follow(p2)
-        else:
-            self.camera.follow(p1)
+        players = self.scene.players
+        try:
+            i = players.index(self.camera.following)
+            self.camera.follow(players[(i+1) % len(players)])
+        except ValueError:
+            self.camera.follow(players[0])
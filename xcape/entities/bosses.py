@@ -39,19 +39,57 @@ class PigBoss(GameObject, pg.sprite.Sprite):
         return "pig_boss"
 
     def handleEvent(self, event):
-        print("{} is safely ignored event {}".format(self.__str__(), event))
+        pass
 
     def update(self):
         self.updateRenderState()
         self.updateAudioState()
         self.updateDialogueState()
         self.updateAIState()
-        self.physics.update()
 
     def draw(self, camera=None):
         self.render.draw(camera)
         self.dialogue.draw(camera)
 
+    def snapshot(self):
+        """
+        Captures the position and the state of the AI of the boss.
+
+        :return: Tuple, containing the state of the boss.
+        """
+        patterns, loci = self._copyAttacks(self.attackPatterns,
+                                           self.attackLoci)
+        return (self.rect.copy(),
+                self.AIState,
+                self.following,
+                patterns,
+                loci,
+                self.attackPoint,
+                self.attackSpeed,
+                self.travelOffset)
+
+    def reset(self, state):
+        """
+        Brings the boss back to a previously captured state, and starts its
+        machine sound again (which is stopped when a player dies).
+
+        :param state: Tuple, returned by snapshot.
+        """
+        (rect, self.AIState, self.following, patterns, loci,
+         self.attackPoint, self.attackSpeed, self.travelOffset) = state
+        self.attackPatterns, self.attackLoci = self._copyAttacks(patterns,
+                                                                  loci)
+
+        self.rect.topleft = rect.topleft
+        self.rect.size = rect.size
+        self.physics.reset()
+
+        self.render.state = "running"
+        self.render.orientation = "left"
+        self.dialogue.index = None
+        self.dialogueOrigin = pg.time.get_ticks()
+        self._playMachine()
+
     def updateAudioState(self):
         """
         Adjusts the volume based on proximity to targets.
@@ -60,30 +98,21 @@ class PigBoss(GameObject, pg.sprite.Sprite):
         minVolume = 0.1
         scaleVolume = 0.5
 
-        try:
-            p1, p2 = self.targets
-            x, y = self.rect.center
-            x1, y1 = p1.rect.center
-            x2, y2 = p2.rect.center
-
-            d1 = Vector2(x - x1, y - y1)
-            d2 = Vector2(x - x2, y - y2)
-            distance = min(d1.length(), d2.length(), maxDistance)
-
-            vol = max((minVolume, (1-(distance/maxDistance))*scaleVolume))
-            self.audio.sound.set_volume(vol)
-            self.audio.update()
-        except ValueError:
-            p1, = self.targets
-            x, y = self.rect.center
-            x1, y1 = p1.rect.center
+        # Only the targets within earshot can be the nearest
+        targets = self.targets
+        if self.scene:
+            nearby = self.scene.queryRadius(self.rect.center, maxDistance,
+                                            ["players"])
+            targets = [t for t in nearby if t in self.targets]
 
-            d1 = Vector2(x - x1, y - y1)
-            distance = min(d1.length(), maxDistance)
+        x, y = self.rect.center
+        distances = [Vector2(x - t.rect.centerx, y - t.rect.centery).length()
+                     for t in targets]
+        distance = min(distances + [maxDistance])
 
-            vol = max((minVolume, (1-(distance/maxDistance))*scaleVolume))
-            self.audio.sound.set_volume(vol)
-            self.audio.update()
+        vol = max((minVolume, (1-(distance/maxDistance))*scaleVolume))
+        self.audio.sound.set_volume(vol)
+        self.audio.update()
 
     def updateRenderState(self):
         """
@@ -160,14 +189,17 @@ class PigBoss(GameObject, pg.sprite.Sprite):
                         self.attackSpeed,
                         self.physics.travelled - self.travelOffset)
 
-    def target(self, gameObjects):
+    def target(self, gameObjects, scene=None):
         """
         Sets the target that the boss is hunting.
 
         :param gameObjects: List, containing gameObject instances.
+        :param scene: Scene Class, the level that the targets are found in by
+        position, or None to measure the distance to every target.
         """
         self.targets = gameObjects
         self.following = gameObjects[0]
+        self.scene = scene
 
     def retreat(self, radius, speed):
         """
@@ -269,15 +301,9 @@ class PigBoss(GameObject, pg.sprite.Sprite):
                                                         self.isSpiralPattern,
                                                         self.isSweepPattern,
                                                         self.isStompPattern)
-        try:
-            p1, p2 = self.targets
-            if self.following == p1:
-                self.following = p2
-            elif self.following == p2:
-                self.following = p1
-        except ValueError:
-            print("'{}' is not switching targets as there is only a single "
-                  "target '{}'".format(self.__str__(), self.targets[0]))
+        if self.following in self.targets:
+            i = self.targets.index(self.following)
+            self.following = self.targets[(i+1) % len(self.targets)]
 
         if not self.attackLoci:
             nameToSpeed = \
@@ -361,9 +387,28 @@ class PigBoss(GameObject, pg.sprite.Sprite):
         patterns = OrderedDict(patterns)
         return patterns
 
+    def _copyAttacks(self, patterns, loci):
+        """
+        Copies the attacks left for the boss to make, since the points of an
+        attack are consumed as the boss moves through them.
+
+        :param patterns: OrderedDict, mapping attack name to a list of
+        points, or None if no attacks have been generated.
+        :param loci: List, containing the points left of the current attack,
+        or None if no attack has started.
+        :return: 2-Tuple, containing the copied patterns and loci.
+        """
+        if patterns is not None:
+            patterns = OrderedDict((name, list(points))
+                                   for name, points in patterns.items())
+        if loci is not None:
+            loci = list(loci)
+        return patterns, loci
+
     def _initialiseRenderer(self):
         pig = CHARACTER_RESOURCES["pig"]
-        self.render = RenderComponent(self, enableOrientation=True)
+        self.render = RenderComponent(self, enableOrientation=True,
+                                      enableMasks=True)
         self.render.add("idle", pig["running"][0])
         self.render.add("running", pig["running"], 400)
         self.render.scaleAll(self.rect.size)
@@ -376,7 +421,9 @@ class PigBoss(GameObject, pg.sprite.Sprite):
                                     isRepeat=False)
         self.audio.add("machine", SFX_RESOURCES["pig_machine"])
         self.audio.add("attack", SFX_RESOURCES["pig_attack"])
+        self._playMachine()
 
+    def _playMachine(self):
         # Plays machine sonud endlessly
         self.audio.state = "machine"
         self.audio.sound.play(loops=-1)
@@ -403,12 +450,14 @@ class PigBoss(GameObject, pg.sprite.Sprite):
         self.AIState = "no_aggro"
         self.following = None
         self.targets = []
+        self.scene = None
 
         self.attackPatterns = None
         self.attackLoci = None
         self.attackPoint = None
         self.attackSpeed = 0
         self.attackTravelled = 0
+        self.travelOffset = 0
 
         self.isSquarePattern = True
         self.isTrianglePattern = True
@@ -41,7 +41,6 @@ class PlayerBase(GameObject, pg.sprite.Sprite):
     def update(self):
         self.render.update()
         self.audio.update()
-        self.physics.update()
 
         # Hacky solution to fix hit box sizes without tampering with the
         # animation images directly (too much effort at this point)
@@ -71,6 +70,39 @@ class PlayerBase(GameObject, pg.sprite.Sprite):
     def draw(self, camera=None):
         self.render.draw(camera)
 
+    def subscribe(self, router):
+        """
+        Subscribes the character to the keys controlling it.
+
+        :param router: EventRouter instance, delivering the events of a scene.
+        """
+        router.subscribe(self.handleEvent, pg.KEYDOWN,
+                         [self.keybinds["jump"]])
+        router.subscribe(self.handleEvent, pg.KEYUP,
+                         [self.keybinds["move_left"],
+                          self.keybinds["move_right"]])
+
+    def snapshot(self):
+        """
+        Captures the state of the character that changes while playing.
+
+        :return: pygame.Rect, the rect of the character.
+        """
+        return self.rect.copy()
+
+    def reset(self, state):
+        """
+        Brings the character back to a previously captured state.
+
+        :param state: pygame.Rect, the rect returned by snapshot.
+        """
+        self.rect.topleft = state.topleft
+        self.rect.size = state.size
+        self.isOnGround = False
+        self.physics.reset()
+        self.render.state = "idle"
+        self.render.orientation = "right"
+
     def jump(self):
         """
         Makes the character jump.
@@ -2,20 +2,31 @@
 Contains all the entities in a scene (excluding the players and bosses).
 """
 
+import math
+
 import pygame as pg
 
 from xcape.common.loader import ZONE1_RESOURCES, ZONE2_RESOURCES, SFX_RESOURCES
 from xcape.common.object import GameObject
+from xcape.common.registry import UpdateTier
 from xcape.components.audio import AudioComponent
 from xcape.components.physics import PhysicsComponent
 from xcape.components.render import RenderComponent, buildParts, replicate
 
+# The range of the entities updated only near the camera or the players. It
+# is far enough that the camera (which moves up to five physics steps of 100
+# pixels in a frame) cannot bring a suspended entity into view before the
+# entity is next updated.
+NEARBY = UpdateTier(radius=512)
+
 
 class Decoration(GameObject):
     """
     An entity that does nothing other than act as a background decoration.
     """
 
+    UPDATE_TIER = NEARBY
+
     def __init__(self, x, y, image, screen):
         """
         :param x: Integer, the x-position of the wall.
@@ -27,7 +38,8 @@ class Decoration(GameObject):
         self.render = RenderComponent(self)
         self.render.add("idle", image)
         self.render.state = "idle"
-        self.rect = pg.Rect(x, y, 0, 0)
+        self.render.place(x, y)
+        self.isStatic = self.render.isStill()
 
     def __str__(self):
         return "decoration"
@@ -35,6 +47,15 @@ class Decoration(GameObject):
     def update(self):
         self.render.update()
 
+    def resume(self, ticks):
+        """
+        Catches the animation up on the frames missed while out of sight.
+
+        :param ticks: List, containing the times (in milliseconds) of the
+        missed frames.
+        """
+        self.render.catchUp(ticks)
+
     def draw(self, camera=None):
         self.render.draw(camera)
 
@@ -66,7 +87,8 @@ class Wall(GameObject):
         self.render = RenderComponent(self)
         self.render.add("idle", image)
         self.render.state = "idle"
-        self.rect = pg.Rect(x, y, 0, 0)
+        self.render.place(x, y)
+        self.isStatic = self.render.isStill()
 
     def __str__(self):
         return "wall"
@@ -109,7 +131,8 @@ class SPlatform(GameObject):
         self.render = RenderComponent(self)
         self.render.add("idle", image)
         self.render.state = "idle"
-        self.rect = pg.Rect(x, y, 0, 0)
+        self.render.place(x, y)
+        self.isStatic = self.render.isStill()
 
     def __str__(self):
         return "static_platform"
@@ -153,7 +176,8 @@ class DPlatform(GameObject):
         self.render = RenderComponent(self)
         self.render.add("idle", image)
         self.render.state = "idle"
-        self.rect = pg.Rect(x, y, 0, 0)
+        self.render.place(x, y)
+        self.isStatic = self.render.isStill()
 
     def __str__(self):
         return "directional_platform"
@@ -168,14 +192,20 @@ class DPlatform(GameObject):
 class MPlatform(GameObject):
     """
     A moving platform entity that constantly moves between two points.
+
+    Away from the camera and the players the platform is suspended, and its
+    body made dormant, since nothing can stand on it or see it. When it is
+    resumed it is moved to where it would have been by then.
     """
 
+    UPDATE_TIER = NEARBY
+
     def __init__(self, A, B, dx, dy, screen, image):
         """
         :param A: 2-Tuple, containing coordinates of a point A.
         :param B: 2-Tuple, containing coordinates of a point B.
-        :param dx: Number, pixels moved in the x-axis every physics tick.
-        :param dy: Number, pixels moved in the y-axis every physics tick.
+        :param dx: Number, pixels moved in the x-axis every physics step.
+        :param dy: Number, pixels moved in the y-axis every physics step.
         :param screen: pygame.Surface, the screen to draw the wall onto.
         :param image: pygame.Surface, the image of the platform.
         """
@@ -193,19 +223,45 @@ class MPlatform(GameObject):
         self.render = RenderComponent(self)
         self.render.add("idle", image)
         self.render.state = "idle"
-        self.rect = pg.Rect(A[0], A[1], 0, 0)
+        self.render.place(*A)
+
+        # Where the platform can be along its path, even while suspended
+        self.reach = self.rect.union(pg.Rect(B, self.rect.size))
 
     def __str__(self):
         return "moving_platform"
 
     def update(self):
-        # Physics update at start because it seems there is a mismatch of clock
-        # between moving platform and the player; the proper solution involves
-        # coding a physics engine that synchronises all physics updates.
-        # Try moving the physics update post the change in self.dx variables
-        # and the bug of the player standing on the moving platform appears.
-        self.physics.update()
+        self.render.update()
+
+    def draw(self, camera=None):
+        self.render.draw(camera)
+
+    def snapshot(self):
+        """
+        Captures the phase of the platform along its path.
+
+        :return: Tuple, containing the position, displacements and directions.
+        """
+        return (self.rect.topleft, self.dx, self.dy,
+                self.isDirectionX, self.isDirectionY)
 
+    def reset(self, state):
+        """
+        Brings the platform back to a previously captured phase.
+
+        :param state: Tuple, returned by snapshot.
+        """
+        (self.rect.topleft, self.dx, self.dy,
+         self.isDirectionX, self.isDirectionY) = state
+        self.physics.reset()
+
+    def prestep(self):
+        """
+        Turns the platform around once it has passed either end of its path,
+        which is done before every physics step (rather than every frame) so
+        that it never overshoots when several steps are taken in a frame.
+        """
         xBoundA, yBoundA = self.A
         xBoundB, yBoundB = self.B
 
@@ -223,13 +279,80 @@ class MPlatform(GameObject):
             self.dy *= -1
             self.isDirectionY = True
 
-        self.physics.addDisplacementX("move", self.dx)
-        self.physics.addDisplacementY("move", self.dy)
+        self.physics.fixVelocityX(self.dx)
+        self.physics.fixVelocityY(self.dy)
 
-        self.render.update()
+    def suspend(self):
+        """
+        Stops the platform, until it is resumed.
+        """
+        self.physics.isDormant = True
 
-    def draw(self, camera=None):
-        self.render.draw(camera)
+    def resume(self, ticks):
+        """
+        Moves the platform to where it would have been had it not been
+        stopped, then starts it again.
+
+        :param ticks: List, containing the times (in milliseconds) of the
+        missed frames (unused, since its body counts the physics steps it
+        missed).
+        """
+        self.advance(self.physics.dormantSteps)
+        self.physics.isDormant = False
+        self.physics.dormantSteps = 0
+
+    def advance(self, steps):
+        """
+        Moves the platform along its path by as far as it travels in the
+        given number of physics steps.
+
+        :param steps: Integer, the number of physics steps.
+        """
+        x, self.dx, self.isDirectionX = self._travel(
+            self.rect.x, self.dx, self.isDirectionX, self.A[0], self.B[0],
+            steps)
+        y, self.dy, self.isDirectionY = self._travel(
+            self.rect.y, self.dy, self.isDirectionY, self.A[1], self.B[1],
+            steps)
+        self.physics.moveTo(x, y)
+
+    @staticmethod
+    def _travel(position, speed, isDirection, boundA, boundB, steps):
+        """
+        Travels back and forth between two bounds along a single axis.
+
+        The platform only turns around once it has passed a bound, i.e. at
+        the first position past it that a whole number of steps reaches. The
+        path between these turning points is unfolded into a loop, so that
+        the position after any number of steps is found directly rather than
+        by stepping through them.
+
+        :param position: Number, the position along the axis.
+        :param speed: Number, pixels moved along the axis every physics step.
+        :param isDirection: Boolean, whether moving from bound A to bound B.
+        :param boundA: Number, the position of bound A along the axis.
+        :param boundB: Number, the position of bound B along the axis.
+        :param steps: Integer, the number of physics steps.
+        :return: 3-Tuple, the new (position, speed, isDirection).
+        """
+        speed = abs(speed)
+        if not speed:
+            return position, speed, isDirection
+
+        high = position + (math.floor((boundB - position)/speed) + 1)*speed
+        low = position - (math.floor((position - boundA)/speed) + 1)*speed
+        length = high - low
+        if length <= 0:
+            return position, speed if isDirection else -speed, isDirection
+
+        offset = min(max(position - low, 0), length)
+        if not isDirection:
+            offset = 2*length - offset
+        offset = (offset + speed*steps) % (2*length)
+
+        if offset <= length:
+            return low + offset, speed, True
+        return low + 2*length - offset, -speed, False
 
 
 class Switch(GameObject):
@@ -260,7 +383,7 @@ class Switch(GameObject):
         self.render.add("on", [button["switch"][0]])
         self.render.add("off", button["switch"], 500)
         self.render.state = "on"
-        self.rect = pg.Rect(x, y, 0, 0)
+        self.render.place(x, y)
 
         self.audio = AudioComponent(self, isAutoPlay=False)
         self.audio.add("click", SFX_RESOURCES["scene_switch"])
@@ -284,6 +407,23 @@ class Switch(GameObject):
         self.audio.state = "click"
         self.messageScene("switch", (self.num, self.isOn))
 
+    def snapshot(self):
+        """
+        Captures whether the switch is on.
+
+        :return: Boolean, whether the switch is on.
+        """
+        return self.isOn
+
+    def reset(self, state):
+        """
+        Turns the switch back on or off without sending out an event.
+
+        :param state: Boolean, returned by snapshot.
+        """
+        self.isOn = state
+        self.render.state = "on" if self.isOn else "off"
+
 
 class Door(GameObject):
     """
@@ -315,7 +455,7 @@ class Door(GameObject):
         self.render.add("open", door["open"])
         self.render.add("closed", door["close"])
         self.render.state = "closed"
-        self.rect = pg.Rect(x, y, 0, 0)
+        self.render.place(x, y)
 
         self.audio = AudioComponent(self, isAutoPlay=False)
         self.audio.add("open", SFX_RESOURCES["scene_door"])
@@ -323,6 +463,15 @@ class Door(GameObject):
     def __str__(self):
         return "door_{}".format(self.num)
 
+    def subscribe(self, router):
+        """
+        Subscribes the door to the events of the scene, e.g. switches being
+        turned off.
+
+        :param router: EventRouter instance, delivering the events of a scene.
+        """
+        router.subscribe(self.handleEvent, self.SCENE_EVENT)
+
     def handleEvent(self, event):
         if event.type == self.SCENE_EVENT:
             if event.category == "switch":
@@ -354,6 +503,24 @@ class Door(GameObject):
         self.audio.state = "open"
         self.messageScene("door", (self.num, self.isClosed))
 
+    def snapshot(self):
+        """
+        Captures whether the door is closed and the switches it waits for.
+
+        :return: 2-Tuple, containing the state of the door.
+        """
+        return self.isClosed, tuple(self.switchesWaiting)
+
+    def reset(self, state):
+        """
+        Closes or opens the door again without sending out an event.
+
+        :param state: 2-Tuple, returned by snapshot.
+        """
+        self.isClosed, switchesWaiting = state
+        self.switchesWaiting = list(switchesWaiting)
+        self.render.state = "closed" if self.isClosed else "open"
+
 
 class Spike(GameObject):
     """
@@ -370,10 +537,11 @@ class Spike(GameObject):
         self.screen = screen
 
         image = replicate(blocks, orientation, image)
-        self.render = RenderComponent(self)
+        self.render = RenderComponent(self, enableMasks=True)
         self.render.add("idle", image)
         self.render.state = "idle"
-        self.rect = pg.Rect(x, y, 0, 0)
+        self.render.place(x, y)
+        self.isStatic = self.render.isStill()
 
     def update(self):
         self.render.update()
@@ -387,6 +555,8 @@ class Spear(GameObject):
     A spear entity that kills the player.
     """
 
+    UPDATE_TIER = NEARBY
+
     def __init__(self, x, y, screen):
         """
         :param x: Integer, the x-position of the wall.
@@ -396,13 +566,28 @@ class Spear(GameObject):
         self.screen = screen
 
         assets = ZONE2_RESOURCES["traps"]["spear"]
-        self.render = RenderComponent(self)
+        self.render = RenderComponent(self, enableMasks=True)
         self.render.add("idle", assets)
         self.render.state = "idle"
-        self.rect = pg.Rect(x, y, 0, 0)
+        self.render.place(x, y)
+        self.isStatic = self.render.isStill()
+
+        # Where the spear can thrust to, whichever frame it is on
+        width = max(image.get_width() for image in assets)
+        height = max(image.get_height() for image in assets)
+        self.reach = pg.Rect(x, y, width, height)
 
     def update(self):
         self.render.update()
 
+    def resume(self, ticks):
+        """
+        Catches the thrusting up on the frames missed while out of reach.
+
+        :param ticks: List, containing the times (in milliseconds) of the
+        missed frames.
+        """
+        self.render.catchUp(ticks)
+
     def draw(self, camera=None):
         self.render.draw(camera)